@@ -0,0 +1,374 @@
+"""
+LED Matrix Benchmark Suite
+
+Measures the performance of the display runtime, the image converter and
+pattern loading with reproducible scenarios, so changes can be compared
+against a saved baseline. Runs on any machine: the display scenarios use
+the emulated I2C bus from display/emulator.py.
+
+Scenarios:
+- display: frames/sec, I2C bytes/frame and modeled frames/sec on the bus
+  for walls of 1, 3, 6 and 24 tiles, each frame changing every tile
+- display legacy: the original fill() + pixel() loop on one tile, for
+  reference
+- conversion: images/sec of image_to_pattern() in convert-image-to-bytes.py
+  (PNG decode included), and patterns/sec of batch packing in memory
+- import: cold and cached import time and peak memory of a generated
+  patterns module with 40, 10k and 100k patterns, and the open time and
+  peak memory of the same library as a binary pattern pack
+
+Usage:
+    python benchmark.py                       # Run everything
+    python benchmark.py --only display        # Run one group
+    python benchmark.py --baseline benchmark-results/old.json
+
+Results are saved as JSON in the benchmark-results folder.
+
+Dependencies:
+- adafruit-circuitpython-ht16k33 (display scenarios)
+- Pillow (conversion scenario)
+"""
+
+#!/usr/bin/env python3
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from display.engine import DisplayEngine
+from display.topology import parse_topology
+
+RESULTS_DIR = 'benchmark-results'
+
+# HT16K33 backpacks can use addresses 0x70-0x77, so 8 tiles per bus
+ADDRESSES_PER_BUS = 8
+
+# Fixed seed so every run uses the same patterns and images
+SEED = 1234
+
+
+def random_patterns(count, rng):
+    """Return a dictionary of count random 8-byte patterns"""
+    return {f"pattern_{i:06d}": bytes(rng.getrandbits(8) for _ in range(8)) for i in range(count)}
+
+
+def wall_topology(tiles):
+    """Build an emulated topology with the given number of tiles"""
+    columns = min(tiles, 6)
+    config = {
+        'name': f"{tiles} tile benchmark wall",
+        'buses': {},
+        'tiles': [],
+    }
+    for i in range(tiles):
+        bus = str(i // ADDRESSES_PER_BUS + 1)
+        config['buses'][bus] = {'type': 'emulated'}
+        config['tiles'].append({
+            'bus': bus,
+            'address': 0x70 + i % ADDRESSES_PER_BUS,
+            'x': i % columns,
+            'y': i // columns,
+        })
+    return parse_topology(config)
+
+
+def bench_display(tiles, frames, patterns):
+    """Change every tile on each frame and measure throughput"""
+    engine = DisplayEngine(wall_topology(tiles))
+    engine.start()
+    engine.show()
+    engine.wait()
+    for bus in engine.buses.values():
+        bus.reset_stats()
+
+    pattern_list = list(patterns.values())
+    rng = random.Random(SEED)
+    start = time.perf_counter()
+    for _ in range(frames):
+        for tile in engine.tiles:
+            engine.canvas.set_tile(tile.x, tile.y, rng.choice(pattern_list))
+        engine.show()
+        engine.wait()
+    elapsed = time.perf_counter() - start
+
+    buses = list(engine.buses.values())
+    bytes_sent = sum(bus.bytes_sent for bus in buses)
+    # Buses run in parallel, so the slowest bus sets the frame period
+    bus_time = max(bus.bus_time for bus in buses)
+    return {
+        'tiles': tiles,
+        'buses': len(buses),
+        'frames': frames,
+        'frames_per_sec': frames / elapsed,
+        'i2c_bytes_per_frame': bytes_sent / frames,
+        'bus_frames_per_sec': frames / bus_time if bus_time else None,
+    }
+
+
+def bench_display_legacy(frames, patterns):
+    """Time the original fill() + pixel() display loop on one tile
+
+    The original scripts created matrices with the driver's default
+    auto_write=True, so every fill() and pixel() call also sent the frame.
+    """
+    from adafruit_ht16k33.matrix import Matrix8x8
+    from display.emulator import EmulatedI2C
+
+    bus = EmulatedI2C()
+    matrix = Matrix8x8(bus, address=0x70)
+    bus.reset_stats()
+
+    pattern_list = list(patterns.values())
+    rng = random.Random(SEED)
+    start = time.perf_counter()
+    for _ in range(frames):
+        matrix.fill(0)
+        for row, byte_val in enumerate(rng.choice(pattern_list)):
+            for col in range(8):
+                if (byte_val >> (7 - col)) & 1:
+                    matrix.pixel(col, row, 1)
+        matrix.show()
+    elapsed = time.perf_counter() - start
+    return {
+        'tiles': 1,
+        'frames': frames,
+        'frames_per_sec': frames / elapsed,
+        'i2c_bytes_per_frame': bus.bytes_sent / frames,
+        'bus_frames_per_sec': frames / bus.bus_time,
+    }
+
+
+def load_script(filename, module_name):
+    """Import one of the hyphen-named scripts as a module"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def bench_conversion(count, rng):
+    """Convert count random 8x8 PNGs with image_to_pattern()"""
+    from PIL import Image
+
+    converter = load_script('convert-image-to-bytes.py', 'convert_image_to_bytes')
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(count):
+            image = Image.new('L', (8, 8))
+            image.putdata([255 if rng.random() < 0.5 else 0 for _ in range(64)])
+            path = os.path.join(tmp, f"pixel_art_{i:06d}_8x8.png")
+            image.save(path)
+            paths.append(path)
+
+        start = time.perf_counter()
+        for path in paths:
+            converter.image_to_pattern(path)
+        elapsed = time.perf_counter() - start
+
+    # Threshold and pack a stack of images already in memory
+    from patterns.convert import pack_stack
+    batch = 100000
+    pixels = bytes(rng.getrandbits(8) for _ in range(64)) * batch
+    start = time.perf_counter()
+    pack_stack(pixels, 8, 8)
+    pack_elapsed = time.perf_counter() - start
+    return {
+        'images': count,
+        'images_per_sec': count / elapsed,
+        'batch_patterns_per_sec': batch / pack_elapsed,
+    }
+
+
+# Peak memory of the probe process. ru_maxrss can include memory of the
+# forked benchmark process before exec, so prefer VmHWM on Linux
+_PEAK_RSS = """
+import resource
+def peak_rss_kb():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+"""
+
+# Run in a fresh interpreter so nothing is already imported or cached in memory
+_IMPORT_PROBE = _PEAK_RSS + """
+import sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+from bench_patterns import PATTERNS
+elapsed = time.perf_counter() - start
+print(elapsed, len(PATTERNS), peak_rss_kb())
+"""
+
+
+# Opens a pack and reads one random entry, as the display does at startup
+_PACK_PROBE = _PEAK_RSS + """
+import random, sys, time
+sys.path.insert(0, sys.argv[2])
+start = time.perf_counter()
+from patterns.pack import PatternPack
+pack = PatternPack(sys.argv[1])
+pack.entry(random.randrange(len(pack)))
+elapsed = time.perf_counter() - start
+print(elapsed, len(pack), peak_rss_kb())
+"""
+
+
+def _probe(code, *args):
+    output = subprocess.run(
+        [sys.executable, '-c', code, *args],
+        check=True, capture_output=True, text=True,
+    ).stdout.split()
+    return float(output[0]), int(output[1]), int(output[2])
+
+
+def bench_import(count, rng):
+    """Measure loading a generated library as a module and as a pack"""
+    from patterns.pack import write_pack, write_patterns_module
+
+    repo = os.path.dirname(os.path.abspath(__file__))
+    patterns = random_patterns(count, rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        write_patterns_module(os.path.join(tmp, 'bench_patterns.py'), patterns)
+        # First import compiles the source, second one loads the cached .pyc
+        cold, loaded, max_rss = _probe(_IMPORT_PROBE, tmp)
+        cached, _, _ = _probe(_IMPORT_PROBE, tmp)
+
+        pack_path = os.path.join(tmp, 'bench_patterns.bin')
+        write_pack(pack_path, patterns)
+        pack_open, _, pack_rss = _probe(_PACK_PROBE, pack_path, repo)
+    return {
+        'patterns': loaded,
+        'cold_import_sec': cold,
+        'cached_import_sec': cached,
+        'max_rss_kb': max_rss,
+        'pack_open_sec': pack_open,
+        'pack_max_rss_kb': pack_rss,
+    }
+
+
+def run(args):
+    rng = random.Random(SEED)
+    results = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+    }
+    groups = args.only or ['display', 'conversion', 'import']
+
+    if 'display' in groups:
+        patterns = random_patterns(max(args.patterns), random.Random(SEED))
+        results['display'] = []
+        for tiles in args.tiles:
+            print(f"Display: {tiles} tiles...")
+            results['display'].append(bench_display(tiles, args.frames, patterns))
+        print("Display: legacy pixel loop...")
+        results['display_legacy'] = bench_display_legacy(args.frames, patterns)
+
+    if 'conversion' in groups:
+        print(f"Conversion: {args.images} images...")
+        results['conversion'] = bench_conversion(args.images, rng)
+
+    if 'import' in groups:
+        results['import'] = []
+        for count in args.patterns:
+            print(f"Import: {count} patterns...")
+            results['import'].append(bench_import(count, rng))
+
+    return results
+
+
+def print_results(results, baseline=None):
+    """Print results, with the change against a baseline where available"""
+    def compare(group, key, value, match=None):
+        if not baseline or value is None:
+            return ""
+        entries = baseline.get(group)
+        if isinstance(entries, list):
+            entries = [e for e in entries if match is None or all(e.get(k) == v for k, v in match.items())]
+            entries = entries[0] if entries else None
+        old = entries.get(key) if entries else None
+        if not old:
+            return ""
+        return f" ({(value - old) / old * 100:+.1f}% vs baseline)"
+
+    for entry in results.get('display', []):
+        match = {'tiles': entry['tiles']}
+        print(f"display {entry['tiles']:>3} tiles: "
+              f"{entry['frames_per_sec']:10.1f} frames/s{compare('display', 'frames_per_sec', entry['frames_per_sec'], match)}, "
+              f"{entry['i2c_bytes_per_frame']:7.1f} I2C bytes/frame, "
+              f"{entry['bus_frames_per_sec']:7.1f} frames/s on the bus")
+    if 'display_legacy' in results:
+        entry = results['display_legacy']
+        print(f"display legacy loop: {entry['frames_per_sec']:10.1f} frames/s, "
+              f"{entry['i2c_bytes_per_frame']:7.1f} I2C bytes/frame")
+    if 'conversion' in results:
+        entry = results['conversion']
+        print(f"conversion: {entry['images_per_sec']:.1f} images/s"
+              f"{compare('conversion', 'images_per_sec', entry['images_per_sec'])}, "
+              f"batch packing {entry['batch_patterns_per_sec']:.0f} patterns/s")
+    for entry in results.get('import', []):
+        match = {'patterns': entry['patterns']}
+        print(f"import {entry['patterns']:>7} patterns: "
+              f"cold {entry['cold_import_sec'] * 1000:9.1f} ms"
+              f"{compare('import', 'cold_import_sec', entry['cold_import_sec'], match)}, "
+              f"cached {entry['cached_import_sec'] * 1000:8.1f} ms, "
+              f"max RSS {entry['max_rss_kb'] / 1024:.1f} MB; "
+              f"pack open {entry['pack_open_sec'] * 1000:.1f} ms"
+              f"{compare('import', 'pack_open_sec', entry['pack_open_sec'], match)}, "
+              f"max RSS {entry['pack_max_rss_kb'] / 1024:.1f} MB")
+
+
+def parse_counts(text):
+    return [int(value) for value in text.split(',')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark display, conversion and pattern loading")
+    parser.add_argument('--only', action='append', choices=['display', 'conversion', 'import'],
+                        help="Run only this group (can be repeated)")
+    parser.add_argument('--tiles', type=parse_counts, default=[1, 3, 6, 24],
+                        help="Comma-separated wall sizes for the display scenarios")
+    parser.add_argument('--patterns', type=parse_counts, default=[40, 10000, 100000],
+                        help="Comma-separated library sizes for the import scenarios")
+    parser.add_argument('--frames', type=int, default=1000,
+                        help="Frames per display scenario")
+    parser.add_argument('--images', type=int, default=1000,
+                        help="Images for the conversion scenario")
+    parser.add_argument('--baseline', help="Earlier results file to compare against")
+    parser.add_argument('--output', help="Where to save results (default: benchmark-results/<timestamp>.json)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = run(args)
+    print()
+    print_results(results, baseline)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,14 @@ Features a grid-based drawing interface with live preview and gallery view.
 Features:
 - Configurable matrix layout (multiple 8x8 matrices)
 - 7 LED color options (White, Red, Yellow-Green, Blue, Yellow, Green, Amber)
-- Click and drag drawing interface
-- Live gallery view of saved designs
+- Click and drag drawing interface, with fast strokes drawn as continuous lines
+- Grid drawn as a single scaled image, so large layouts (e.g. 16x16 matrices)
+  start and redraw quickly
+- Live gallery view of saved designs, with thumbnails cached in .thumbnails
+  and loaded in the background
 - High-resolution (288x288) and low-resolution (8x8) image export
+- Drawing stored as packed 1-bit rows (display/canvas.py), so exports take
+  the same time for any layout size
 - Dark theme interface
 - Right-click to delete saved designs
 
@@ -29,9 +34,48 @@ Dependencies:
 
 import tkinter as tk
 from tkinter import simpledialog, messagebox
-from PIL import Image, ImageDraw, ImageTk
+from PIL import Image, ImageTk
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import glob
 import os
+import queue
+
+from display.canvas import Canvas
+
+# Gallery thumbnails, cached on disk between runs
+THUMBNAIL_SIZE = (120, 120)  # Small enough for four columns
+THUMBNAIL_DIR = '.thumbnails'
+GALLERY_COLUMNS = 4
+
+# Editor squares shrink for large layouts so the canvas stays this size (px)
+SQUARE_SIZE = 36  # Also the scale of the high-res export
+MAX_CANVAS_SIZE = 576
+MIN_SQUARE_SIZE = 3
+MIN_GRID_LINE_SIZE = 8  # Smaller squares only get lines between matrices
+
+# Threads decoding thumbnails, and how often the UI picks up their results (ms)
+THUMBNAIL_WORKERS = 4
+THUMBNAIL_POLL_MS = 30
+
+def line_cells(row0, col0, row1, col1):
+    """Grid cells on the line between two cells, both included (Bresenham)"""
+    d_col = abs(col1 - col0)
+    d_row = -abs(row1 - row0)
+    step_col = 1 if col0 < col1 else -1
+    step_row = 1 if row0 < row1 else -1
+    error = d_col + d_row
+    while True:
+        yield row0, col0
+        if row0 == row1 and col0 == col1:
+            return
+        double = 2 * error
+        if double >= d_row:
+            error += d_row
+            col0 += step_col
+        if double <= d_col:
+            error += d_col
+            row0 += step_row
 
 def ensure_directories():
     """Create necessary directories if they don't exist"""
@@ -39,6 +83,58 @@ def ensure_directories():
         if not os.path.exists(directory):
             os.makedirs(directory)
 
+class ThumbnailCache:
+    """Gallery thumbnails stored on disk, keyed by drawing file name and mtime
+    
+    A drawing is only decoded and scaled down the first time it is seen or
+    after it changes; otherwise its small cached thumbnail is read.
+    Safe to use from worker threads.
+    """
+    
+    def __init__(self, directory=THUMBNAIL_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, filename, mtime_ns):
+        stem = os.path.splitext(filename)[0]
+        return os.path.join(self.directory, f"{stem}_{mtime_ns}.png")
+    
+    def _cached_paths(self, filename):
+        """Every cached thumbnail of a drawing, whatever its mtime"""
+        stem = os.path.splitext(filename)[0]
+        pattern = os.path.join(glob.escape(self.directory), f"{glob.escape(stem)}_*.png")
+        return [path for path in glob.glob(pattern)
+                if os.path.basename(path)[len(stem) + 1:-4].isdigit()]
+    
+    def load(self, path):
+        """Return the thumbnail of a drawing as a PIL image"""
+        filename = os.path.basename(path)
+        cached = self._path(filename, os.stat(path).st_mtime_ns)
+        try:
+            with Image.open(cached) as img:
+                img.load()
+                return img
+        except OSError:
+            pass  # Not cached yet, or the drawing changed
+        
+        with Image.open(path) as img:
+            img.thumbnail(THUMBNAIL_SIZE)
+        
+        # Drop thumbnails of older versions, then store this one
+        self.discard(filename)
+        tmp_path = f"{cached}.tmp"
+        img.save(tmp_path, format='PNG')
+        os.replace(tmp_path, cached)
+        return img
+    
+    def discard(self, filename):
+        """Remove the cached thumbnails of a drawing"""
+        for cached in self._cached_paths(filename):
+            try:
+                os.remove(cached)
+            except OSError:
+                pass
+
 class MatrixConfigDialog(simpledialog.Dialog):
     def body(self, master):
         tk.Label(master, text="Enter matrix configuration:").grid(row=0, columnspan=2)
@@ -109,9 +205,10 @@ class PixelDrawer:
         self.LED_COLOR = config_dialog.result_color
         
         # Constants for the grid
-        self.SQUARE_SIZE = 36
         self.GRID_WIDTH = 8 * self.MATRIX_COLS
         self.GRID_HEIGHT = 8 * self.MATRIX_ROWS
+        self.SQUARE_SIZE = max(MIN_SQUARE_SIZE, min(
+            SQUARE_SIZE, MAX_CANVAS_SIZE // max(self.GRID_WIDTH, self.GRID_HEIGHT)))
         
         # Create split view
         self.split_frame = tk.Frame(root, bg='#2B2B2B')
@@ -133,8 +230,9 @@ class PixelDrawer:
         # Create gallery components
         self.create_gallery()
         
-        # Store rectangle references
-        self.rectangles = []
+        # The drawing itself: packed 1-bit rows, the same format as the
+        # LED patterns; the Tk canvas only mirrors it
+        self.pixels = Canvas(self.MATRIX_COLS, self.MATRIX_ROWS)
         
         # Create grid of black squares
         self.create_grid()
@@ -143,11 +241,22 @@ class PixelDrawer:
         self.canvas.bind('<Button-1>', self.on_click)
         self.canvas.bind('<B1-Motion>', self.on_drag)
         
-        # Add state to track the current drawing color
-        self.current_draw_color = None
+        # Whether the current stroke turns pixels on or off, and the last
+        # cell it reached
+        self.draw_state = None
+        self.last_cell = None
+        
+        # Gallery tiles by file name, in display order (newest first)
+        self.gallery_files = []
+        self.gallery_tiles = {}
+        self.thumbnail_cache = ThumbnailCache()
+        self.thumbnail_pool = ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS)
+        self.thumbnail_results = queue.Queue()
+        self.placeholder = tk.PhotoImage(width=THUMBNAIL_SIZE[0], height=THUMBNAIL_SIZE[1])
         
         # Load existing images
         self.load_gallery_images()
+        self.root.after(THUMBNAIL_POLL_MS, self.poll_thumbnails)
 
     def create_editor(self):
         """Create the pixel editor side"""
@@ -282,58 +391,96 @@ class PixelDrawer:
         )
 
     def load_gallery_images(self):
-        """Load and display existing high-res images"""
+        """Add a tile for every saved drawing; thumbnails load in the background"""
         try:
             image_files = sorted(
                 [f for f in os.listdir('saved-drawings') if f.endswith('.png')],
                 reverse=True
             )
-            
-            row = 0
-            col = 0
-            for img_file in image_files:
+        except Exception as e:
+            print(f"Error loading gallery: {e}")
+            return
+        
+        for img_file in image_files:
+            self.gallery_tiles[img_file] = self.create_gallery_tile(img_file)
+        self.gallery_files = image_files
+        self.layout_gallery()
+
+    def create_gallery_tile(self, img_file):
+        """Create a gallery tile showing a placeholder until its thumbnail is ready"""
+        # Create frame for image
+        img_frame = tk.Frame(
+            self.gallery_grid,
+            bg='#1E1E1E',
+            padx=2,
+            pady=2
+        )
+        
+        # Add image label
+        label = tk.Label(
+            img_frame,
+            image=self.placeholder,
+            bg='#333333'
+        )
+        label.image = self.placeholder  # Keep reference
+        label.filename = img_file  # Store filename for deletion
+        label.pack()
+        
+        # Bind right-click event
+        label.bind('<Button-3>', self.show_context_menu)
+        
+        # Decode the thumbnail on a worker thread
+        img_path = os.path.join('saved-drawings', img_file)
+        future = self.thumbnail_pool.submit(self.thumbnail_cache.load, img_path)
+        future.add_done_callback(lambda done: self.thumbnail_results.put((img_file, done)))
+        return img_frame
+
+    def poll_thumbnails(self):
+        """Show thumbnails finished by the worker threads (Tk is only used here)"""
+        try:
+            while True:
+                img_file, future = self.thumbnail_results.get_nowait()
+                tile = self.gallery_tiles.get(img_file)
+                if tile is None or future.cancelled():
+                    continue  # Deleted while loading
                 try:
-                    # Load and resize image
-                    img_path = os.path.join('saved-drawings', img_file)
-                    img = Image.open(img_path)
-                    img.thumbnail((120, 120))  # Smaller thumbnails for four columns
-                    
-                    # Convert to PhotoImage
-                    photo = ImageTk.PhotoImage(img)
-                    
-                    # Create frame for image
-                    img_frame = tk.Frame(
-                        self.gallery_grid,
-                        bg='#1E1E1E',
-                        padx=2,
-                        pady=2
-                    )
-                    img_frame.grid(row=row, column=col, padx=6, pady=6)  # Reduced padding
-                    
-                    # Add image label
-                    label = tk.Label(
-                        img_frame,
-                        image=photo,
-                        bg='#333333'
-                    )
-                    label.image = photo  # Keep reference
-                    label.filename = img_file  # Store filename for deletion
-                    label.pack()
-                    
-                    # Bind right-click event
-                    label.bind('<Button-3>', self.show_context_menu)
-                    
-                    # Update grid position
-                    col += 1
-                    if col >= 4:  # Changed to 4 columns
-                        col = 0
-                        row += 1
-                        
+                    photo = ImageTk.PhotoImage(future.result())
                 except Exception as e:
                     print(f"Error loading image {img_file}: {e}")
-                    
-        except Exception as e:
-            print(f"Error loading gallery: {e}")
+                    continue
+                label = tile.winfo_children()[0]
+                label.configure(image=photo)
+                label.image = photo  # Keep reference
+        except queue.Empty:
+            pass
+        self.root.after(THUMBNAIL_POLL_MS, self.poll_thumbnails)
+
+    def layout_gallery(self, start=0):
+        """Place gallery tiles from position start onwards in the grid"""
+        for index in range(start, len(self.gallery_files)):
+            row, col = divmod(index, GALLERY_COLUMNS)
+            self.gallery_tiles[self.gallery_files[index]].grid(row=row, column=col, padx=6, pady=6)  # Reduced padding
+
+    def add_gallery_image(self, img_file):
+        """Insert one new drawing into the gallery, keeping newest first"""
+        if img_file in self.gallery_tiles:
+            self.remove_gallery_image(img_file)
+        index = 0
+        while index < len(self.gallery_files) and self.gallery_files[index] > img_file:
+            index += 1
+        self.gallery_files.insert(index, img_file)
+        self.gallery_tiles[img_file] = self.create_gallery_tile(img_file)
+        self.layout_gallery(index)
+
+    def remove_gallery_image(self, img_file):
+        """Remove one drawing's tile from the gallery"""
+        tile = self.gallery_tiles.pop(img_file, None)
+        if tile is None:
+            return
+        index = self.gallery_files.index(img_file)
+        del self.gallery_files[index]
+        tile.destroy()
+        self.layout_gallery(index)
 
     def show_context_menu(self, event):
         """Show right-click context menu for image deletion"""
@@ -366,30 +513,46 @@ class PixelDrawer:
                     if os.path.exists(low_res_path):
                         os.remove(low_res_path)
                 
-                # Refresh gallery
-                self.clear_gallery()
-                self.load_gallery_images()
+                # Remove just this tile and its cached thumbnail
+                self.remove_gallery_image(label.filename)
+                self.thumbnail_cache.discard(label.filename)
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete image: {e}")
 
     def create_grid(self):
-        for row in range(self.GRID_HEIGHT):
-            row_rectangles = []
-            for col in range(self.GRID_WIDTH):
-                x1 = col * self.SQUARE_SIZE
-                y1 = row * self.SQUARE_SIZE
-                x2 = x1 + self.SQUARE_SIZE
-                y2 = y1 + self.SQUARE_SIZE
-                
-                rectangle = self.canvas.create_rectangle(
-                    x1, y1, x2, y2,
-                    fill='black',
-                    outline='gray'
-                )
-                row_rectangles.append(rectangle)
-            self.rectangles.append(row_rectangles)
-    
+        """Show the drawing as one image scaled up to SQUARE_SIZE, under grid lines
+        
+        A single image and a few lines keep startup and redraws fast for
+        any layout size, where a canvas item per square does not.
+        """
+        width = self.GRID_WIDTH * self.SQUARE_SIZE
+        height = self.GRID_HEIGHT * self.SQUARE_SIZE
+        self.grid_image = tk.PhotoImage(width=width, height=height)
+        self.grid_image.put('black', to=(0, 0, width, height))
+        self.canvas.create_image(0, 0, image=self.grid_image, anchor=tk.NW)
+        
+        # Lines between squares, or only between matrices if squares are tiny
+        step = 1 if self.SQUARE_SIZE >= MIN_GRID_LINE_SIZE else 8
+        for col in range(0, self.GRID_WIDTH + 1, step):
+            x = min(col * self.SQUARE_SIZE, width - 1)
+            self.canvas.create_line(x, 0, x, height, fill='gray')
+        for row in range(0, self.GRID_HEIGHT + 1, step):
+            y = min(row * self.SQUARE_SIZE, height - 1)
+            self.canvas.create_line(0, y, width, y, fill='gray')
+
+    def set_cell(self, row, col, on):
+        """Set one pixel of the drawing, repainting its square only if it changed"""
+        if self.pixels.pixel(col, row) == on:
+            return
+        self.pixels.pixel(col, row, on)
+        x1 = col * self.SQUARE_SIZE
+        y1 = row * self.SQUARE_SIZE
+        self.grid_image.put(
+            self.LED_COLOR if on else 'black',
+            to=(x1, y1, x1 + self.SQUARE_SIZE, y1 + self.SQUARE_SIZE)
+        )
+
     def on_click(self, event):
         # Convert click coordinates to grid position
         col = event.x // self.SQUARE_SIZE
@@ -397,36 +560,28 @@ class PixelDrawer:
         
         # Ensure we're within grid bounds
         if row >= self.GRID_HEIGHT or col >= self.GRID_WIDTH:
+            self.draw_state = None
             return
             
-        # Get the clicked rectangle
-        rectangle = self.rectangles[row][col]
-        
-        # Toggle color and set current drawing color
-        current_color = self.canvas.itemcget(rectangle, 'fill')
-        self.current_draw_color = self.LED_COLOR if current_color == 'black' else 'black'
-        self.canvas.itemconfig(rectangle, fill=self.current_draw_color)
+        # Toggle the pixel; the stroke keeps drawing with its new state
+        self.draw_state = not self.pixels.pixel(col, row)
+        self.set_cell(row, col, self.draw_state)
+        self.last_cell = (row, col)
     
     def on_drag(self, event):
         # Convert drag coordinates to grid position
         col = event.x // self.SQUARE_SIZE
         row = event.y // self.SQUARE_SIZE
-        
-        # Ensure we're within grid bounds
-        if row >= self.GRID_HEIGHT or col >= self.GRID_WIDTH or row < 0 or col < 0:
+        if self.draw_state is None or (row, col) == self.last_cell:
             return
-            
-        # Get the rectangle under the cursor
-        rectangle = self.rectangles[row][col]
         
-        # Set to current drawing color (established by initial click)
-        if self.current_draw_color is not None:
-            self.canvas.itemconfig(rectangle, fill=self.current_draw_color)
-
-    def clear_gallery(self):
-        """Clear all images from the gallery grid"""
-        for widget in self.gallery_grid.winfo_children():
-            widget.destroy()
+        # Fill in the cells skipped between motion events, so fast strokes
+        # draw a continuous line
+        for line_row, line_col in line_cells(*self.last_cell, row, col):
+            # Ensure we're within grid bounds
+            if 0 <= line_row < self.GRID_HEIGHT and 0 <= line_col < self.GRID_WIDTH:
+                self.set_cell(line_row, line_col, self.draw_state)
+        self.last_cell = (row, col)
 
     def save_all(self):
         """Save both high-res and low-res images"""
@@ -438,49 +593,27 @@ class PixelDrawer:
         # Save images
         self.save_drawing(timestamp)
         
-        # Refresh gallery view
-        self.clear_gallery()
-        self.load_gallery_images()
+        # Add just the new drawing to the gallery
+        self.add_gallery_image(f"pixel_art_{timestamp}.png")
+
+    def export_drawing(self):
+        """Build the high-res and low-res images of the drawing
+        
+        The packed pixels are already a 1-bit image, so each output is a
+        single Pillow call rather than a loop over every cell.
+        """
+        size = (self.pixels.width, self.pixels.height)
+        low_res_image = Image.frombytes('1', size, bytes(self.pixels.data)).convert('RGB')
+        hi_res_image = low_res_image.resize(
+            (size[0] * SQUARE_SIZE, size[1] * SQUARE_SIZE),
+            Image.NEAREST
+        )
+        return hi_res_image, low_res_image
 
     def save_drawing(self, timestamp):
         """Save high-res and low-res PNG images"""
-        # Create high-res image
-        hi_res_image = Image.new('RGB', (self.GRID_WIDTH * self.SQUARE_SIZE, 
-                                self.GRID_HEIGHT * self.SQUARE_SIZE), 
-                        'white')
-        hi_res_draw = ImageDraw.Draw(hi_res_image)
-        
-        # Create low-res image (8px × 8px per matrix)
-        low_res_width = 8 * self.MATRIX_COLS
-        low_res_height = 8 * self.MATRIX_ROWS
-        low_res_image = Image.new('RGB', (low_res_width, low_res_height), 'white')
-        low_res_draw = ImageDraw.Draw(low_res_image)
-        
-        # Draw each rectangle in both resolutions
-        for row in range(self.GRID_HEIGHT):
-            for col in range(self.GRID_WIDTH):
-                # High-res coordinates
-                x1 = col * self.SQUARE_SIZE
-                y1 = row * self.SQUARE_SIZE
-                x2 = x1 + self.SQUARE_SIZE
-                y2 = y1 + self.SQUARE_SIZE
-                
-                # Low-res coordinates (1:1 pixel mapping)
-                lx1 = col
-                ly1 = row
-                lx2 = lx1 + 1
-                ly2 = ly1 + 1
-                
-                rectangle = self.rectangles[row][col]
-                color = self.canvas.itemcget(rectangle, 'fill')
-                
-                # Convert LED_COLOR back to white for saving
-                if color == self.LED_COLOR:
-                    color = 'white'
-                
-                # Draw in both images
-                hi_res_draw.rectangle([x1, y1, x2, y2], fill=color)
-                low_res_draw.rectangle([lx1, ly1, lx2, ly2], fill=color)
+        hi_res_image, low_res_image = self.export_drawing()
+        low_res_width, low_res_height = low_res_image.size
         
         # Save images with timestamp
         hi_res_filename = f"saved-drawings/pixel_art_{timestamp}.png"
@@ -492,15 +625,17 @@ class PixelDrawer:
 
     def reset_grid(self):
         # Set all squares back to black
-        for row in range(self.GRID_HEIGHT):
-            for col in range(self.GRID_WIDTH):
-                rectangle = self.rectangles[row][col]
-                self.canvas.itemconfig(rectangle, fill='black')
+        self.pixels.fill(0)
+        self.grid_image.put('black', to=(0, 0, self.grid_image.width(), self.grid_image.height()))
 
 def main():
     root = tk.Tk()
     app = PixelDrawer(root)
     root.mainloop()
+    
+    # Do not wait for thumbnails nobody will see
+    if hasattr(app, 'thumbnail_pool'):
+        app.thumbnail_pool.shutdown(wait=False, cancel_futures=True)
 
 if __name__ == "__main__":
     main()
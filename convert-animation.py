@@ -0,0 +1,87 @@
+"""
+LED Matrix Animation Converter
+
+Converts animated GIF or PNG files into delta-encoded animations for the
+LED matrix player (led-matrix-play.py).
+
+Features:
+- Reads every frame of animated GIF/PNG files, with their durations
+- Converts frames to pure black and white (threshold at 127)
+- 8x8 images animate one matrix; larger images (a multiple of 8 in each
+  direction) are split into 8x8 tiles and animate a whole wall
+- Stores only the rows that change between frames (see patterns/animation.py)
+
+Input:
+- Animated GIF or PNG files given on the command line, or all GIF files
+  in the image-data directory
+
+Output:
+- animations/<name>.leda, one file per input image
+
+Dependencies:
+- Python 3.x
+- Pillow (PIL) for image processing
+"""
+
+#!/usr/bin/env python3
+
+from PIL import Image, ImageSequence
+import os
+import glob
+import argparse
+from patterns.convert import pack_tiles
+from patterns.animation import write_animation, ANIMATION_DIR
+
+# Duration for frames that do not specify one (milliseconds)
+DEFAULT_DURATION_MS = 100
+
+def image_to_frames(image_path, default_duration=DEFAULT_DURATION_MS):
+    """Convert an animated image to (tile columns, tile rows, [(frame bytes, ms), ...])"""
+    frames = []
+    layout = None
+    with Image.open(image_path) as image:
+        for frame in ImageSequence.Iterator(image):
+            tile_columns, tile_rows, frame_data = pack_tiles(frame.convert('L'))
+            layout = (tile_columns, tile_rows)
+            duration = frame.info.get('duration') or default_duration
+            frames.append((frame_data, int(duration)))
+    return layout[0], layout[1], frames
+
+def convert_animation(image_path, output_dir=ANIMATION_DIR, default_duration=DEFAULT_DURATION_MS):
+    """Convert one animated image to an animation file, return its path"""
+    name = os.path.splitext(os.path.basename(image_path))[0]
+    output_path = os.path.join(output_dir, f"{name}.leda")
+    try:
+        tile_columns, tile_rows, frames = image_to_frames(image_path, default_duration)
+        size = write_animation(output_path, frames, tile_columns, tile_rows)
+    except Exception as e:
+        print(f"Error processing {image_path}: {e}")
+        return None
+
+    raw_size = len(frames) * 8 * tile_columns * tile_rows
+    print(f"Converted {os.path.basename(image_path)}: {len(frames)} frames, "
+          f"{tile_columns}x{tile_rows} tiles, {size} bytes ({raw_size} bytes uncompressed)")
+    return output_path
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert animated images into LED matrix animations")
+    parser.add_argument('images', nargs='*',
+                        help="Animated GIF/PNG files (default: image-data/*.gif)")
+    parser.add_argument('--duration', type=int, default=DEFAULT_DURATION_MS,
+                        help=f"Duration in ms for frames without one (default {DEFAULT_DURATION_MS})")
+    args = parser.parse_args()
+
+    images = args.images or sorted(glob.glob("image-data/*.gif"))
+    if not images:
+        print("No animated images found in 'image-data' directory")
+        return
+
+    os.makedirs(ANIMATION_DIR, exist_ok=True)
+    converted = sum(
+        convert_animation(image_path, default_duration=args.duration) is not None
+        for image_path in images
+    )
+    print(f"\nConversion complete. Converted {converted} out of {len(images)} animations.")
+
+if __name__ == "__main__":
+    main()
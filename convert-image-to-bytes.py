@@ -2,24 +2,35 @@
 LED Matrix Pattern Converter
 
 Converts 8x8 pixel art images into binary patterns for LED matrix displays.
-Reads PNG files from the image-data directory and generates a Python module
-with binary patterns that can be used by the LED matrix display scripts.
+Reads PNG files from the image-data directory and writes binary pattern
+packs (patterns/led_patterns.bin, plus one per larger drawing size) that
+the LED matrix display scripts memory-map. With --module it also writes
+the patterns/led_patterns.py module used before packs existed.
 
 Features:
 - Processes 8x8 PNG images from image-data directory
+- Splits larger drawings (e.g. 24x16 for a 2x3 wall) into 8x8 tiles
 - Converts images to pure black and white (threshold at 127)
 - Generates binary patterns (1 = LED on, 0 = LED off)
-- Creates a Python module with all patterns in a dictionary
+- Creates a binary pattern pack with all patterns
 - Maintains original image names as pattern keys
+- Incremental: only new or changed images are decoded, everything else
+  comes from patterns/led_patterns.manifest.json (use --full to rebuild)
+- Parallel: --jobs N decodes images in N worker processes
 
 Input:
-- 8x8 PNG files in image-data directory
-- Files must be named either 'pixel_art_*8x8*.png' or 'lowres_*.png'
+- PNG files in image-data directory, 8x8 or a multiple of 8 in each direction
+- Files must be named either 'pixel_art_*.png' or 'lowres_*.png'
 
 Output:
-- patterns/led_patterns.py containing a PATTERNS dictionary
-- Each pattern is stored as a bytes object
-- Binary format: 8 bytes, one per row, MSB first
+- patterns/led_patterns.bin, a binary pattern pack (see patterns/pack.py)
+  that the display scripts memory-map instead of importing
+- patterns/led_patterns_{width}x{height}.bin for each larger drawing size,
+  one record per drawing holding its tiles in row-major order (removed
+  again once no drawings of that size are left)
+- With --module, also patterns/led_patterns.py containing a PATTERNS
+  dictionary, each pattern stored as a bytes object
+- Binary format: 8 bytes per tile, one per row, MSB first
 
 Dependencies:
 - Python 3.x
@@ -31,7 +42,11 @@ Dependencies:
 from PIL import Image
 import os
 import glob
+import argparse
 from datetime import datetime
+from patterns.convert import pack_tiles, map_jobs, describe_jobs
+from patterns.pack import write_pack, write_patterns_module, layout_pack_path, MODULE_PATH
+from patterns.manifest import Manifest
 
 def ensure_directories():
     """Create necessary directories if they don't exist"""
@@ -40,100 +55,139 @@ def ensure_directories():
             os.makedirs(directory)
 
 def image_to_pattern(image_path):
-    """Convert an 8x8 image to LED matrix pattern format"""
+    """Convert an image to a (pattern name, pattern bytes, tile layout) triple
+    
+    8x8 images give the usual 8-byte pattern. Larger drawings for
+    multi-matrix walls are split into one 8-byte pattern per tile, stored
+    back to back in row-major order; the layout is (columns, rows).
+    """
     try:
         # Open and verify image
         image = Image.open(image_path)
         
-        # Verify image is 8x8
-        if image.size != (8, 8):
-            print(f"Skipping {image_path}: Invalid dimensions {image.size}, must be 8x8")
+        # Verify image is made of whole 8x8 tiles
+        width, height = image.size
+        if width % 8 or height % 8 or not width or not height:
+            print(f"Skipping {image_path}: Invalid dimensions {image.size}, must be a multiple of 8x8")
             return None
             
-        # Convert to black and white
-        image = image.convert('L')  # Convert to grayscale
-        
-        # Create pattern string
-        pattern_lines = []
-        
-        # Add header
+        # Pattern name from the file name
         pattern_name = os.path.basename(image_path).split('.')[0]
         # Remove 'lowres_' prefix if present
         if pattern_name.startswith('lowres_'):
             pattern_name = pattern_name[7:]
-        pattern_lines.append(f"    '{pattern_name}': bytes([")
-        pattern_lines.append("        # 8x8 matrix pattern")
-        
-        # Process each row
-        for y in range(8):
-            byte_val = 0
-            # Process each pixel in the row
-            for x in range(8):
-                pixel = image.getpixel((x, y))
-                # Convert pixel to bit (white = 1, black = 0)
-                bit = 1 if pixel > 127 else 0
-                byte_val |= (bit << (7 - x))
-            
-            # Format as binary literal
-            binary_str = f"        0b{byte_val:08b},"
-            pattern_lines.append(binary_str)
         
-        # Close the pattern
-        pattern_lines.append("    ]),")
+        # Threshold and bit-pack all rows in one pass, then slice into tiles
+        tile_columns, tile_rows, pattern_data = pack_tiles(image)
         
-        return "\n".join(pattern_lines)
+        return pattern_name, pattern_data, (tile_columns, tile_rows)
         
     except Exception as e:
         print(f"Error processing {image_path}: {e}")
         return None
 
-def convert_all_images():
-    """Convert all 8x8 PNG images in image-data directory to pattern format"""
+def convert_all_images(write_module=False, incremental=True, jobs=1):
+    """Convert all PNG images in image-data directory to pattern packs
+    
+    8x8 images go to patterns/led_patterns.bin, larger drawings to one
+    pack per size (see layout_pack_path()).
+    
+    With incremental=True only images that changed since the last run
+    (according to patterns/led_patterns.manifest.json) are decoded.
+    Decoding is spread over jobs worker processes (0 = one per CPU core).
+    """
     ensure_directories()
     
     # Get all PNG files with either naming pattern
     image_files = (
-        glob.glob("image-data/pixel_art_*8x8*.png") +
+        glob.glob("image-data/pixel_art_*.png") +
         glob.glob("image-data/lowres_*.png")
     )
     
     if not image_files:
-        print("No 8x8 image files found in 'image-data' directory")
+        print("No image files found in 'image-data' directory")
         print("Expected files matching either:")
-        print("- image-data/pixel_art_*8x8*.png")
+        print("- image-data/pixel_art_*.png")
         print("- image-data/lowres_*.png")
         return
     
-    print(f"Found {len(image_files)} images to convert")
+    print(f"Found {len(image_files)} images")
     
-    # Create patterns file
-    with open("patterns/led_patterns.py", "w") as f:
-        # Write file header
-        f.write("# LED Matrix Patterns\n")
-        f.write("# Auto-generated from 8x8 PNG files\n\n")
-        f.write("PATTERNS = {\n")
-        
-        # Process each image
-        for image_path in image_files:
-            print(f"Converting {os.path.basename(image_path)}...")
-            
-            # Convert image to pattern
-            pattern_text = image_to_pattern(image_path)
-            if pattern_text is None:
-                continue
-                
-            # Write pattern to file
-            f.write(pattern_text)
-            f.write("\n\n")
-        
-        # Close the patterns dictionary
-        f.write("}\n")
+    # Only decode images that are new or changed since the last run
+    manifest = Manifest(load=incremental)
+    removed = manifest.prune(image_files)
+    pending = []
+    for image_path in sorted(image_files):
+        entry, stat, digest = manifest.lookup(image_path)
+        if entry is None:
+            pending.append((image_path, stat, digest))
+    converted = len(pending)
     
-    print(f"Patterns saved to patterns/led_patterns.py")
+    if pending:
+        print(f"Converting {converted} images using {describe_jobs(jobs, converted)}...")
+    
+    # Decode in worker processes, results come back in file order
+    results = map_jobs(image_to_pattern, [path for path, _, _ in pending], jobs)
+    for (image_path, stat, digest), result in zip(pending, results):
+        if result is None:
+            manifest.update(image_path, stat, digest, None, None)
+            continue
+        pattern_name, pattern_data, tiles = result
+        manifest.update(image_path, stat, digest, pattern_name, pattern_data, tiles)
+    
+    print(f"{converted} new or changed, {len(image_files) - converted} unchanged, {removed} removed")
+    layouts = manifest.layouts() | {(1, 1)}
+    pack_paths = [layout_pack_path(*tiles) for tiles in layouts]
+    
+    # Packs of layouts whose last drawing was deleted must go too
+    for tiles in sorted(manifest.stale_layouts()):
+        pack_path = layout_pack_path(*tiles)
+        if os.path.exists(pack_path):
+            os.remove(pack_path)
+            print(f"Removed patterns/{os.path.basename(pack_path)}, no drawings of that size are left")
+        manifest.forget_pack(pack_path)
+    
+    # Packs rewritten since the last run (e.g. by web-image-to-bytes.py) are rebuilt
+    if (not manifest.patterns_changed and not write_module and
+            all(manifest.pack_current(path) for path in pack_paths)):
+        # Touched files only need their new timestamps recorded
+        if manifest.changed:
+            manifest.save()
+        print("Patterns are up to date")
+        return
+    
+    # Rebuild the outputs from the manifest, no images need decoding for this
+    # Write one binary pack per layout for the display scripts
+    # Identical patterns are stored once, their other names become aliases
+    for tiles in sorted(layouts):
+        layout_patterns = manifest.patterns(tiles)
+        pack_path = layout_pack_path(*tiles)
+        write_pack(pack_path, layout_patterns, *tiles)
+        manifest.record_pack(pack_path, tiles)
+        distinct = len(set(layout_patterns.values()))
+        print(f"{len(layout_patterns)} patterns saved to patterns/{os.path.basename(pack_path)} "
+              f"({distinct} distinct, {len(layout_patterns) - distinct} duplicates stored as aliases)")
+    
+    if write_module:
+        # The Python module only holds single 8x8 patterns
+        patterns = manifest.patterns()
+        write_patterns_module(MODULE_PATH, patterns, source="8x8 PNG files")
+        print("Patterns module saved to patterns/led_patterns.py")
+    
+    manifest.save()
 
 def main():
+    parser = argparse.ArgumentParser(description="Convert 8x8 images into LED matrix patterns")
+    parser.add_argument('--module', action='store_true',
+                        help="Also write patterns/led_patterns.py as Python source")
+    parser.add_argument('--full', action='store_true',
+                        help="Ignore the manifest and convert every image again")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="Worker processes to decode with (0 = all CPU cores, default 1)")
+    args = parser.parse_args()
+    
     print("Starting image conversion...")
-    convert_all_images()
+    convert_all_images(write_module=args.module, incremental=not args.full, jobs=args.jobs)
     print("Conversion complete!")
 
 if __name__ == "__main__":
@@ -6,11 +6,15 @@ resizes them to 8x8 pixels, and saves them in the 'image-data' directory.
 Uses the same naming convention as bit-draw.py:
 - High-res: pixel_art_{timestamp}.png
 - Low-res: pixel_art_{timestamp}_{width}x{height}.png
+
+Use --jobs N to convert in N worker processes (0 = all CPU cores).
 """
 
 import os
+import argparse
 from PIL import Image
 from datetime import datetime
+from patterns.convert import map_jobs, describe_jobs
 
 # Create directories if they don't exist
 os.makedirs('saved-drawings', exist_ok=True)
@@ -36,34 +40,42 @@ def convert_image(input_path, output_path):
         print(f"Error converting {input_path}: {e}")
         return False
 
+def convert_file(input_file):
+    """Convert one file from saved-drawings into image-data."""
+    input_path = os.path.join('saved-drawings', input_file)
+    
+    # Extract timestamp from filename (assuming format pixel_art_TIMESTAMP.png)
+    try:
+        # Remove 'pixel_art_' prefix and '.png' suffix
+        timestamp = input_file[10:-4]
+    except IndexError:
+        print(f"Skipping {input_file}: Invalid filename format")
+        return False
+        
+    # Create output filename with correct format
+    output_path = os.path.join('image-data', f"pixel_art_{timestamp}_8x8.png")
+    
+    return convert_image(input_path, output_path)
+
 def main():
+    parser = argparse.ArgumentParser(description="Resize saved drawings to 8x8 images")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="Worker processes to convert with (0 = all CPU cores, default 1)")
+    args = parser.parse_args()
+    
     # Get list of PNG files in saved-drawings
-    input_files = [f for f in os.listdir('saved-drawings') if f.lower().endswith('.png')]
+    input_files = sorted(f for f in os.listdir('saved-drawings') if f.lower().endswith('.png'))
     
     if not input_files:
         print("No PNG files found in 'saved-drawings' directory.")
         return
     
-    print(f"Found {len(input_files)} PNG files to convert.")
+    print(f"Found {len(input_files)} PNG files to convert using "
+          f"{describe_jobs(args.jobs, len(input_files))}.")
     
-    # Convert each file
-    success_count = 0
-    for input_file in input_files:
-        input_path = os.path.join('saved-drawings', input_file)
-        
-        # Extract timestamp from filename (assuming format pixel_art_TIMESTAMP.png)
-        try:
-            # Remove 'pixel_art_' prefix and '.png' suffix
-            timestamp = input_file[10:-4]
-        except IndexError:
-            print(f"Skipping {input_file}: Invalid filename format")
-            continue
-            
-        # Create output filename with correct format
-        output_path = os.path.join('image-data', f"pixel_art_{timestamp}_8x8.png")
-        
-        if convert_image(input_path, output_path):
-            success_count += 1
+    # Convert each file, spread over the worker processes
+    results = map_jobs(convert_file, input_files, args.jobs)
+    success_count = sum(results)
     
     print(f"\nConversion complete. Successfully converted {success_count} out of {len(input_files)} files.")
 
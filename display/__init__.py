@@ -0,0 +1,3 @@
+"""
+LED Matrix Display Package
+"""
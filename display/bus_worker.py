@@ -0,0 +1,181 @@
+"""
+Per-Bus I2C Worker Threads
+
+Gives each physical I2C bus its own worker thread and frame queue, so
+several buses transmit at the same time instead of one after another.
+With two buses the time to push a frame becomes the slower of the two
+rather than their sum.
+
+Frames are submitted as (matrix, display RAM) snapshots, so the display
+loop can keep drawing into the driver buffers while a worker is still
+sending the previous frame.
+
+If the bus supports combined transactions (SMBusWrapper.transfer), all
+changes for a frame go out in a single call instead of one per matrix.
+
+The queue is short: when a bus cannot keep up, submitting the next frame
+blocks until the worker has room, so the display loop falls behind
+visibly (as lateness, see display/pacing.py) instead of building an
+ever-growing backlog of stale frames.
+
+Single-byte chip commands (dimming, blink, see display/effects.py) go
+through the same queue, so they stay in order with the frames around
+them and never touch the bus from another thread.
+"""
+
+import queue
+import threading
+import time
+
+from display.diff import FrameDiffer, span_messages
+from display.framebuffer import RAM_SIZE
+
+# Frames and command batches that may wait per bus before submitting blocks
+QUEUE_SIZE = 2
+
+
+class BusWorker(threading.Thread):
+    """Transmits queued frames for all matrices on one I2C bus"""
+
+    def __init__(self, name, differ=None, queue_size=QUEUE_SIZE):
+        super().__init__(name=name, daemon=True)
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.differ = differ if differ is not None else FrameDiffer()
+
+        # Statistics, updated by the worker thread only
+        self.frames_sent = 0
+        self.commands_sent = 0
+        self.bytes_sent = 0
+        self.transfer_time = 0.0
+        self.last_transfer_time = 0.0
+        self.max_transfer_time = 0.0
+        self.max_queue_depth = 0
+        self.errors = 0
+
+    def submit(self, matrices):
+        """Queue the current buffers of the given matrices for transmission"""
+        frame = [(matrix, bytes(matrix._buffer[1:RAM_SIZE + 1])) for matrix in matrices]
+        self._put(self._transmit, frame)
+
+    def submit_commands(self, commands):
+        """Queue (matrix, command byte) pairs for transmission"""
+        self._put(self._send_commands, list(commands))
+
+    def _put(self, handler, item):
+        # Blocks while the queue is full, holding the caller to the bus's pace
+        self.queue.put((handler, item))
+        self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+
+    def wait(self):
+        """Block until every queued frame has been transmitted"""
+        self.queue.join()
+
+    def run(self):
+        while True:
+            handler, item = self.queue.get()
+            try:
+                handler(item)
+            finally:
+                self.queue.task_done()
+
+    def _transmit(self, frame):
+        start = time.perf_counter()
+        bus = _combined_bus(frame)
+        if bus is not None:
+            sent = self._transmit_combined(bus, frame)
+        else:
+            sent = 0
+            for matrix, ram in frame:
+                try:
+                    sent += self.differ.show(matrix, ram)
+                except Exception as e:
+                    self.errors += 1
+                    print(f"{self.name}: Error writing to matrix: {e}")
+        elapsed = time.perf_counter() - start
+
+        self.frames_sent += 1
+        self.bytes_sent += sent
+        self.transfer_time += elapsed
+        self.last_transfer_time = elapsed
+        self.max_transfer_time = max(self.max_transfer_time, elapsed)
+
+    def _send_commands(self, commands):
+        """Send single-byte commands, in one transaction when the bus allows"""
+        bus = _combined_bus(commands)
+        if bus is not None:
+            while not bus.try_lock():
+                pass
+            try:
+                bus.transfer([(matrix.i2c_device[0].device_address, bytes([command]))
+                              for matrix, command in commands])
+            except Exception as e:
+                self.errors += 1
+                print(f"{self.name}: Error writing commands: {e}")
+            finally:
+                bus.unlock()
+        else:
+            for matrix, command in commands:
+                try:
+                    with matrix.i2c_device[0] as device:
+                        device.write(bytes([command]))
+                except Exception as e:
+                    self.errors += 1
+                    print(f"{self.name}: Error writing command to matrix: {e}")
+        self.commands_sent += len(commands)
+
+    def _transmit_combined(self, bus, frame):
+        """Send every matrix's changes in one combined bus transaction"""
+        messages = []
+        for matrix, ram in frame:
+            messages.extend(span_messages(matrix, self.differ.spans(matrix, ram)))
+        if not messages:
+            return 0
+
+        while not bus.try_lock():
+            pass
+        try:
+            bus.transfer(messages)
+        except Exception as e:
+            # Device state is unknown now, so resend full frames next time
+            for matrix, _ in frame:
+                self.differ.forget(matrix)
+            self.errors += 1
+            print(f"{self.name}: Error writing combined transaction: {e}")
+            return 0
+        finally:
+            bus.unlock()
+        # Each payload carries a RAM address byte ahead of its data
+        return sum(len(payload) - 1 for _, payload in messages)
+
+    def stats(self):
+        """Return a snapshot of queue depth and transfer time statistics"""
+        frames = self.frames_sent
+        return {
+            'name': self.name,
+            'queue_depth': self.queue.qsize(),
+            'max_queue_depth': self.max_queue_depth,
+            'frames': frames,
+            'commands': self.commands_sent,
+            'bytes': self.bytes_sent,
+            'avg_transfer_ms': (self.transfer_time / frames * 1000) if frames else 0.0,
+            'last_transfer_ms': self.last_transfer_time * 1000,
+            'max_transfer_ms': self.max_transfer_time * 1000,
+            'errors': self.errors,
+        }
+
+    def report(self):
+        """Return a one-line summary of this bus's statistics"""
+        s = self.stats()
+        return (f"{s['name']}: {s['frames']} frames, {s['commands']} commands, {s['bytes']} bytes, "
+                f"queue {s['queue_depth']} (max {s['max_queue_depth']}), "
+                f"transfer avg {s['avg_transfer_ms']:.2f} ms, "
+                f"max {s['max_transfer_ms']:.2f} ms, errors {s['errors']}")
+
+
+def _combined_bus(items):
+    """Return the shared bus if every matrix in a frame can be batched on it"""
+    buses = {matrix.i2c_device[0].i2c for matrix, _ in items}
+    if len(buses) != 1:
+        return None
+    bus = buses.pop()
+    return bus if hasattr(bus, 'transfer') else None
@@ -0,0 +1,86 @@
+"""
+Virtual Wall Canvas
+
+A single 1-bit drawing surface spanning every tile of a wall. Pixels are
+stored as packed rows (MSB = leftmost pixel), the same format as the
+8-byte patterns, so an 8x8 tile is just every stride-th byte of a column
+and can be read or written with one slice.
+
+The canvas records which tiles changed, so the display engine only
+converts and transmits those.
+"""
+
+from patterns.pack import record_tiles
+
+
+class Canvas:
+    """Packed 1-bit canvas made of columns x rows tiles of 8x8 pixels"""
+
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+        self.width = columns * 8
+        self.height = rows * 8
+        self.stride = columns  # Bytes per pixel row
+        self.data = bytearray(self.stride * self.height)
+        self.dirty = set()
+
+    def _offset(self, tx, ty):
+        if not (0 <= tx < self.columns and 0 <= ty < self.rows):
+            raise IndexError(f"Tile ({tx}, {ty}) is outside the {self.columns}x{self.rows} canvas")
+        return ty * 8 * self.stride + tx
+
+    def tile(self, tx, ty):
+        """Return the 8-byte pattern currently shown on a tile"""
+        offset = self._offset(tx, ty)
+        return bytes(self.data[offset:offset + 8 * self.stride:self.stride])
+
+    def set_tile(self, tx, ty, pattern_data):
+        """Draw an 8-byte pattern onto a tile"""
+        offset = self._offset(tx, ty)
+        self.data[offset:offset + 8 * self.stride:self.stride] = pattern_data
+        self.dirty.add((tx, ty))
+
+    def pixel(self, x, y, value=None):
+        """Get or set a single pixel anywhere on the canvas"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        index = y * self.stride + x // 8
+        mask = 0x80 >> (x % 8)
+        if value is None:
+            return bool(self.data[index] & mask)
+        if value:
+            self.data[index] |= mask
+        else:
+            self.data[index] &= ~mask
+        self.dirty.add((x // 8, y // 8))
+        return None
+
+    def load(self, data):
+        """Replace the whole canvas with packed rows of the same size"""
+        if len(data) != len(self.data):
+            raise ValueError(f"Canvas data must be {len(self.data)} bytes, got {len(data)}")
+        self.data[:] = data
+        self.mark_all()
+
+    def load_tiles(self, pattern_data):
+        """Draw a whole-wall pattern: one 8-byte pattern per tile, row-major"""
+        if len(pattern_data) != 8 * self.columns * self.rows:
+            raise ValueError(f"Wall pattern must be {8 * self.columns * self.rows} bytes, got {len(pattern_data)}")
+        for tx, ty, tile_data in record_tiles(pattern_data, self.columns, self.rows):
+            self.set_tile(tx, ty, tile_data)
+
+    def fill(self, color):
+        """Set every pixel on or off"""
+        self.data[:] = (b'\xff' if color else b'\x00') * len(self.data)
+        self.mark_all()
+
+    def mark_all(self):
+        """Mark every tile as changed"""
+        self.dirty.update((tx, ty) for ty in range(self.rows) for tx in range(self.columns))
+
+    def take_dirty(self):
+        """Return the set of changed tiles and reset it"""
+        dirty = self.dirty
+        self.dirty = set()
+        return dirty
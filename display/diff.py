@@ -0,0 +1,93 @@
+"""
+Dirty-Row Frame Diffing
+
+Remembers the last display RAM image written to each HT16K33 and only
+transmits the byte ranges that changed since then. Unchanged matrices
+cost nothing on the bus, and a pattern that only differs in a few rows
+only sends those rows.
+
+Each HT16K33 write starts with the RAM address to write from, so a
+changed range can be sent on its own as [start address, data...].
+"""
+
+from display.framebuffer import RAM_SIZE
+
+# Starting a new write costs a device address and a RAM address byte, so
+# ranges separated by a gap this small are cheaper to send as one write
+MERGE_GAP = 2
+
+
+def dirty_spans(previous, current, merge_gap=MERGE_GAP):
+    """Return (start, data) ranges of current that differ from previous"""
+    if previous is None:
+        return [(0, bytes(current))]
+
+    spans = []
+    start = None
+    end = None
+    for i in range(len(current)):
+        if current[i] == previous[i]:
+            continue
+        if start is not None and i - end > merge_gap + 1:
+            spans.append((start, bytes(current[start:end + 1])))
+            start = None
+        if start is None:
+            start = i
+        end = i
+    if start is not None:
+        spans.append((start, bytes(current[start:end + 1])))
+    return spans
+
+
+class FrameDiffer:
+    """Tracks the last frame sent to each matrix and writes only changes"""
+
+    def __init__(self, merge_gap=MERGE_GAP):
+        self.merge_gap = merge_gap
+        self._last = {}
+
+    def spans(self, matrix, ram=None):
+        """Return the dirty ranges of a frame and mark them as sent
+
+        The frame defaults to the matrix's own driver buffer.
+        """
+        if ram is None:
+            ram = matrix._buffer[1:RAM_SIZE + 1]
+        current = bytes(ram)
+        spans = dirty_spans(self._last.get(matrix), current, self.merge_gap)
+        self._last[matrix] = current
+        return spans
+
+    def show(self, matrix, ram=None):
+        """Drop-in for matrix.show() that only sends changed ranges
+
+        Returns the number of data bytes transmitted.
+        """
+        spans = self.spans(matrix, ram)
+        if not spans:
+            return 0
+        try:
+            write_spans(matrix, spans)
+        except Exception:
+            # Device state is unknown now, so resend everything next time
+            self.forget(matrix)
+            raise
+        return sum(len(data) for _, data in spans)
+
+    def forget(self, matrix):
+        """Force the next show() of a matrix to send its full frame"""
+        self._last.pop(matrix, None)
+
+
+def span_messages(matrix, spans):
+    """Turn (start, data) ranges into (address, payload) I2C write messages"""
+    address = matrix.i2c_device[0].device_address
+    return [(address, bytes([start]) + data) for start, data in spans]
+
+
+def write_spans(matrix, spans):
+    """Write (start, data) ranges straight into a matrix's display RAM"""
+    device = matrix.i2c_device[0]
+    with device:
+        for start, data in spans:
+            device.write(bytes([start]) + data)
@@ -0,0 +1,143 @@
+"""
+Display Effects
+
+Fades, pulses and blinking done by the HT16K33 itself. The chip has a
+16-level dimming register and a blink register, each set with a single
+command byte, so an effect costs one byte per tile per step instead of
+resending frame data. Commands go through the bus workers, in order with
+the frames around them.
+
+HT16K33 commands used:
+- 0xE0 | level: dimming, level 0 (1/16 duty) to 15 (full brightness)
+- 0x80 | blink << 1 | on: display on/off and blink rate
+
+Dimming level 0 is still lit, so fades to dark finish by switching the
+display off, and fades from dark start by switching it back on.
+
+Usage:
+    effects = Effects(engine)
+    effects.fade_out(0.5)
+    engine.canvas.load_tiles(pattern_data)
+    engine.show()
+    effects.fade_in(0.5)
+"""
+
+import time
+
+from display.pacing import FramePacer
+
+DIMMING_COMMAND = 0xE0
+DISPLAY_COMMAND = 0x80
+DISPLAY_ON = 0x01
+
+MAX_LEVEL = 15
+
+# Hardware blink rates for the blink register
+BLINK_OFF = 0
+BLINK_2HZ = 1
+BLINK_1HZ = 2
+BLINK_HALF_HZ = 3
+
+
+def dimming_command(level):
+    """Command byte setting the dimming level (0-15)"""
+    if not 0 <= level <= MAX_LEVEL:
+        raise ValueError(f"Dimming level must be 0-{MAX_LEVEL}, got {level}")
+    return DIMMING_COMMAND | level
+
+
+def display_command(on=True, blink=BLINK_OFF):
+    """Command byte switching the display on or off with a blink rate"""
+    if not BLINK_OFF <= blink <= BLINK_HALF_HZ:
+        raise ValueError(f"Blink rate must be {BLINK_OFF}-{BLINK_HALF_HZ}, got {blink}")
+    return DISPLAY_COMMAND | blink << 1 | (DISPLAY_ON if on else 0)
+
+
+def fade_levels(start, end):
+    """Dimming levels stepped through going from start to end, excluding start"""
+    step = 1 if end > start else -1
+    return list(range(start + step, end + step, step))
+
+
+class Effects:
+    """Hardware fades, pulses and blinking for the tiles of a DisplayEngine
+
+    Tiles are indexes into engine.tiles; None means every tile. The
+    effect methods block until the effect has finished.
+    """
+
+    def __init__(self, engine, clock=time.monotonic, sleep=time.sleep):
+        self.engine = engine
+        self.pacer = FramePacer(clock, sleep)
+        self.full_level = round(MAX_LEVEL * engine.topology.brightness)
+
+        # Register state of every tile, as set by DisplayEngine.start()
+        count = len(engine.tiles)
+        self.levels = [self.full_level] * count
+        self.blink = [BLINK_OFF] * count
+        self.on = [True] * count
+
+    def _tiles(self, tiles):
+        return range(len(self.engine.tiles)) if tiles is None else list(tiles)
+
+    def _display(self, tiles, on=None, blink=None):
+        commands = []
+        for tile in tiles:
+            if on is not None:
+                self.on[tile] = on
+            if blink is not None:
+                self.blink[tile] = blink
+            commands.append((tile, display_command(self.on[tile], self.blink[tile])))
+        self.engine.send_commands(commands)
+
+    def set_level(self, level, tiles=None):
+        """Set the dimming level of tiles right away"""
+        tiles = self._tiles(tiles)
+        command = dimming_command(level)
+        for tile in tiles:
+            self.levels[tile] = level
+        self.engine.send_commands([(tile, command) for tile in tiles])
+
+    def set_blink(self, rate, tiles=None):
+        """Start hardware blinking (BLINK_2HZ, BLINK_1HZ, BLINK_HALF_HZ) or stop it (BLINK_OFF)"""
+        self._display(self._tiles(tiles), blink=rate)
+
+    def set_on(self, on, tiles=None):
+        """Switch tiles on or off without touching their display RAM"""
+        self._display(self._tiles(tiles), on=on)
+
+    def fade(self, level, duration, tiles=None):
+        """Step the dimming level of tiles to level over duration seconds
+
+        All tiles are expected to start at the same level, that of the
+        first tile.
+        """
+        tiles = self._tiles(tiles)
+        if not tiles:
+            return
+        levels = fade_levels(self.levels[tiles[0]], level)
+        if not levels:
+            return
+        self.pacer.start()
+        for step in levels:
+            self.set_level(step, tiles)
+            self.pacer.wait(duration / len(levels))
+
+    def fade_in(self, duration, tiles=None):
+        """Switch tiles on at the lowest level and fade up to full brightness"""
+        tiles = self._tiles(tiles)
+        self.set_level(0, tiles)
+        self.set_on(True, tiles)
+        self.fade(self.full_level, duration, tiles)
+
+    def fade_out(self, duration, tiles=None):
+        """Fade tiles down to the lowest level and switch them off"""
+        tiles = self._tiles(tiles)
+        self.fade(0, duration, tiles)
+        self.set_on(False, tiles)
+
+    def pulse(self, period, cycles=1, low=0, tiles=None):
+        """Fade tiles down to low and back up to full brightness, cycles times"""
+        for _ in range(cycles):
+            self.fade(low, period / 2, tiles)
+            self.fade(self.full_level, period / 2, tiles)
@@ -0,0 +1,170 @@
+"""
+Emulated HT16K33 I2C Bus
+
+An in-process stand-in for a busio.I2C bus with HT16K33 matrices on it,
+for running and benchmarking the display engine without a Raspberry Pi.
+
+Features:
+- Models each HT16K33's display RAM, oscillator, display/blink setup and
+  dimming registers
+- Records every I2C message (address and bytes) sent on the bus
+- Models bus time from the clock rate: 9 bit times per byte (8 data bits
+  plus ACK) for the address and data bytes, plus start/stop conditions
+- Optionally sleeps for the modeled time, so threaded bus workers
+  behave like they would on real hardware
+- Supports combined transactions like SMBusWrapper.transfer()
+
+Use it through a topology bus entry of type "emulated", or run any show
+script with --emulate. Only adafruit-circuitpython-ht16k33 needs to be
+installed; it works on any machine.
+"""
+
+import errno
+import threading
+import time
+
+from display.framebuffer import ROW_TABLE
+
+# Standard-mode I2C clock used by the Pi unless configured otherwise
+DEFAULT_CLOCK_HZ = 100000
+
+# Bit times for start and stop conditions around each transaction
+START_STOP_BITS = 2
+
+# Reverse of framebuffer.ROW_TABLE, turns RAM bytes back into pattern rows
+_PATTERN_TABLE = bytes(ROW_TABLE.index(value) for value in range(256))
+
+
+class EmulatedHT16K33:
+    """Register model of a single HT16K33 driver chip"""
+
+    def __init__(self, address):
+        self.address = address
+        self.ram = bytearray(16)
+        self.pointer = 0
+        self.oscillator = False
+        self.display_on = False
+        self.blink_rate = 0
+        self.dimming = 15
+
+    def write(self, data):
+        """Handle one I2C write addressed to this chip"""
+        if not data:
+            return  # Address-only probe
+        command = data[0]
+        kind = command & 0xF0
+        if kind == 0x00:
+            # Display RAM write, starting at the given address and wrapping
+            self.pointer = command & 0x0F
+            for value in data[1:]:
+                self.ram[self.pointer] = value
+                self.pointer = (self.pointer + 1) % len(self.ram)
+        elif kind == 0x20:
+            self.oscillator = bool(command & 0x01)
+        elif kind == 0x80:
+            self.display_on = bool(command & 0x01)
+            self.blink_rate = (command >> 1) & 0x03
+        elif kind == 0xE0:
+            self.dimming = command & 0x0F
+
+    def pattern(self):
+        """Return the 8-byte pattern currently held in display RAM"""
+        return bytes(self.ram[0::2]).translate(_PATTERN_TABLE)
+
+
+class EmulatedI2C:
+    """busio.I2C-compatible bus that records traffic to emulated HT16K33s
+
+    If addresses is given, only those devices answer and writes to any
+    other address fail like a missing device would. Otherwise a device is
+    created the first time an address is used.
+    """
+
+    def __init__(self, addresses=None, clock_hz=DEFAULT_CLOCK_HZ, realtime=False, name="Emulated"):
+        self.name = name
+        self.clock_hz = clock_hz
+        self.realtime = realtime
+        self.strict = addresses is not None
+        self.devices = {address: EmulatedHT16K33(address) for address in (addresses or [])}
+        self.log = []
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Clear the recorded traffic and counters"""
+        self.log.clear()
+        self.transactions = 0
+        self.messages = 0
+        self.bytes_sent = 0
+        self.bus_time = 0.0
+
+    # busio.I2C interface
+
+    def try_lock(self):
+        return self._lock.acquire(blocking=False)
+
+    def unlock(self):
+        self._lock.release()
+
+    def scan(self):
+        return sorted(self.devices)
+
+    def writeto(self, address, buffer, *, start=0, end=None, stop=True):
+        if end is None:
+            end = len(buffer)
+        self._transact([(address, bytes(buffer[start:end]))])
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        if end is None:
+            end = len(buffer)
+        self._device(address)
+        for i in range(start, end):
+            buffer[i] = 0
+        self._account([(address, bytes(end - start))])
+
+    def transfer(self, messages):
+        """Write several (address, data) messages as one combined transaction"""
+        self._transact([(address, bytes(data)) for address, data in messages])
+
+    # Emulation
+
+    def _device(self, address):
+        device = self.devices.get(address)
+        if device is None:
+            if self.strict:
+                raise OSError(errno.EREMOTEIO, f"No device at address 0x{address:02X}")
+            device = self.devices[address] = EmulatedHT16K33(address)
+        return device
+
+    def _transact(self, messages):
+        for address, data in messages:
+            self._device(address).write(data)
+            self.log.append((address, data))
+        self._account(messages)
+
+    def _account(self, messages):
+        """Update counters and model the time the transaction takes on the wire"""
+        data_bytes = sum(len(data) for _, data in messages)
+        duration = self.transaction_time(data_bytes, len(messages))
+
+        self.transactions += 1
+        self.messages += len(messages)
+        self.bytes_sent += data_bytes
+        self.bus_time += duration
+        if self.realtime:
+            time.sleep(duration)
+
+    def transaction_time(self, data_bytes, messages=1):
+        """Modeled wire time of a transaction carrying data_bytes in total
+
+        Every byte, plus one address byte per message, takes 9 clocks;
+        each extra message in a combined transaction needs a repeated start.
+        """
+        bits = START_STOP_BITS + 9 * (messages + data_bytes) + messages - 1
+        return bits / self.clock_hz
+
+    def report(self):
+        """Return a one-line summary of the recorded traffic"""
+        return (f"{self.name}: {self.transactions} transactions, {self.messages} messages, "
+                f"{self.bytes_sent} bytes, {self.bus_time * 1000:.2f} ms bus time "
+                f"at {self.clock_hz / 1000:g} kHz")
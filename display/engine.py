@@ -0,0 +1,122 @@
+"""
+LED Wall Display Engine
+
+Drives any number of HT16K33 8x8 matrices described by a topology file
+(see display/topology.py) as one virtual canvas.
+
+Features:
+- Hardware is only touched in start(), never at import time
+- emulate=True runs on emulated buses (display/emulator.py) without a Pi
+- One worker thread per I2C bus, so buses transmit concurrently
+- Only tiles that changed on the canvas are converted and queued
+- Only rows that changed on a tile are sent over I2C
+- Combined transactions on buses that support them (SMBusWrapper)
+- Dimming and blink commands queued alongside frames (display/effects.py)
+
+Usage:
+    engine = DisplayEngine(load_topology('2x3'))
+    engine.start()
+    engine.canvas.set_tile(0, 0, pattern_data)
+    engine.show()
+"""
+
+from display.bus_worker import BusWorker
+from display.canvas import Canvas
+from display.framebuffer import blit_rows
+
+
+def open_bus(config, bus_id=None, emulate=False):
+    """Open the I2C bus described by a topology bus entry
+
+    With emulate=True every bus is replaced by an EmulatedI2C running at
+    the configured clock_hz, so no hardware is needed.
+    """
+    bus_type = 'emulated' if emulate else config.get('type', 'board')
+    if bus_type == 'emulated':
+        from display.emulator import EmulatedI2C, DEFAULT_CLOCK_HZ
+        return EmulatedI2C(
+            clock_hz=config.get('clock_hz', DEFAULT_CLOCK_HZ),
+            realtime=config.get('realtime', emulate),
+            name=f"Emulated bus {bus_id}",
+        )
+    if bus_type == 'board':
+        import board
+        return board.I2C()
+    if bus_type == 'smbus':
+        from display.smbus_wrapper import SMBusWrapper
+        return SMBusWrapper(int(config['number']))
+    raise ValueError(f"Unknown bus type: {bus_type}")
+
+
+class DisplayEngine:
+    """Renders a virtual canvas onto every matrix of a wall"""
+
+    def __init__(self, topology, emulate=False):
+        self.topology = topology
+        self.emulate = emulate
+        self.tiles = topology.tiles
+        self.canvas = Canvas(topology.columns, topology.rows)
+        self.buses = {}
+        self.workers = {}
+        self.matrices = []
+        # Map canvas tile positions to topology tile indexes
+        self._tile_index = {(tile.x, tile.y): i for i, tile in enumerate(self.tiles)}
+
+    def start(self):
+        """Open the buses, initialize every matrix and start the bus workers"""
+        from adafruit_ht16k33.matrix import Matrix8x8
+
+        for bus_id, config in self.topology.buses.items():
+            self.buses[bus_id] = open_bus(config, bus_id, self.emulate)
+            self.workers[bus_id] = BusWorker(f"Bus {bus_id}")
+
+        for tile in self.tiles:
+            matrix = Matrix8x8(self.buses[tile.bus], address=tile.address, auto_write=False)
+            matrix.brightness = self.topology.brightness
+            matrix.blink_rate = 0  # Disable blinking
+            self.matrices.append(matrix)
+
+        for worker in self.workers.values():
+            worker.start()
+
+        # Start from a known blank display on every tile
+        self.canvas.mark_all()
+
+    def show(self):
+        """Send every tile that changed on the canvas to its matrix"""
+        changed = {}
+        for position in self.canvas.take_dirty():
+            index = self._tile_index.get(position)
+            if index is None:
+                continue  # No matrix at this grid position
+            tile = self.tiles[index]
+            matrix = self.matrices[index]
+            blit_rows(matrix, self.canvas.tile(tile.x, tile.y))
+            changed.setdefault(tile.bus, []).append(matrix)
+
+        for bus_id, matrices in changed.items():
+            self.workers[bus_id].submit(matrices)
+        return sum(len(matrices) for matrices in changed.values())
+
+    def send_commands(self, commands):
+        """Queue single-byte chip commands as (tile index, command) pairs
+
+        Commands are sent by each bus's worker, in order with the frames
+        queued before and after them (see display/effects.py).
+        """
+        by_bus = {}
+        for index, command in commands:
+            by_bus.setdefault(self.tiles[index].bus, []).append((self.matrices[index], command))
+        for bus_id, bus_commands in by_bus.items():
+            self.workers[bus_id].submit_commands(bus_commands)
+
+    def wait(self):
+        """Block until every bus has finished transmitting"""
+        for worker in self.workers.values():
+            worker.wait()
+
+    def report(self):
+        """Return summary lines for every bus worker and emulated bus"""
+        lines = [worker.report() for worker in self.workers.values()]
+        lines += [bus.report() for bus in self.buses.values() if hasattr(bus, 'report')]
+        return lines
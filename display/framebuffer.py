@@ -0,0 +1,36 @@
+"""
+HT16K33 Framebuffer
+
+Converts 8x8 patterns into the exact display RAM layout used by the
+HT16K33 driver chip, so a pattern change is a table lookup and a single
+buffer copy instead of a fill() followed by up to 64 pixel() calls.
+
+Layout:
+- The HT16K33 has 16 bytes of display RAM, two bytes per row
+- For an 8x8 matrix only the first byte of each pair is used
+- The Adafruit 8x8 backpack wires column 0 to bit 7 and columns 1-7
+  to bits 0-6, which is what Matrix8x8.pixel() compensates for
+"""
+
+# Size of the HT16K33 display RAM in bytes
+RAM_SIZE = 16
+
+
+def _row_to_ram(byte_val):
+    """Map a pattern row (MSB = column 0) to the backpack's bit order"""
+    ram_val = 0
+    for col in range(8):
+        if (byte_val >> (7 - col)) & 1:
+            ram_val |= 1 << ((col - 1) % 8)
+    return ram_val
+
+
+# Lookup table used with bytes.translate() to convert a whole pattern at once
+ROW_TABLE = bytes(_row_to_ram(value) for value in range(256))
+
+
+def blit_rows(matrix, pattern_data):
+    """Convert an 8-byte pattern straight into a Matrix8x8 buffer"""
+    # Byte 0 of the driver buffer is the RAM start address, row bytes follow
+    # it at every other position; the unused odd bytes stay zero
+    matrix._buffer[1:RAM_SIZE + 1:2] = bytes(pattern_data).translate(ROW_TABLE)
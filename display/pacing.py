@@ -0,0 +1,101 @@
+"""
+Frame Pacing
+
+Keeps frames on a fixed timeline. Every frame has an absolute deadline
+on the monotonic clock, computed from the previous deadline rather than
+from when the previous frame finished, so render and I2C time never
+accumulate as drift: a frame that runs long simply leaves less sleep
+before the next one.
+
+When the loop falls too far behind (a stalled bus, a busy Pi), the
+pacer drops the backlog and restarts the timeline from now instead of
+rushing out a burst of catch-up frames.
+
+Every frame's lateness (how long after its deadline it actually started)
+is recorded in a histogram, printed with the other display statistics.
+"""
+
+import time
+
+# Upper bounds of the lateness histogram buckets, in milliseconds
+LATENESS_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100)
+
+# Lateness (seconds) after which the pacer gives up catching up
+MAX_LAG = 0.25
+
+
+class LatenessHistogram:
+    """Counts of frame lateness in millisecond buckets"""
+
+    def __init__(self, buckets=LATENESS_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last bucket is everything above
+        self.frames = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, lateness):
+        """Add one frame that started lateness seconds after its deadline"""
+        lateness_ms = max(lateness, 0.0) * 1000
+        for i, bound in enumerate(self.buckets):
+            if lateness_ms < bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.frames += 1
+        self.total += lateness_ms
+        self.max = max(self.max, lateness_ms)
+
+    def report(self):
+        """One-line summary: count per bucket, average and worst lateness"""
+        if not self.frames:
+            return "Lateness: no frames"
+        buckets = [f"<{bound}ms {count}" for bound, count in zip(self.buckets, self.counts)]
+        buckets.append(f">={self.buckets[-1]}ms {self.counts[-1]}")
+        return (f"Lateness: {', '.join(buckets)}; "
+                f"avg {self.total / self.frames:.2f} ms, max {self.max:.2f} ms")
+
+
+class FramePacer:
+    """Sleeps between frames against absolute monotonic deadlines"""
+
+    def __init__(self, clock=time.monotonic, sleep=time.sleep, max_lag=MAX_LAG):
+        self.clock = clock
+        self.sleep = sleep
+        self.max_lag = max_lag
+        self.deadline = None
+        self.lateness = LatenessHistogram()
+        self.overruns = 0  # Frames that were already late when their wait began
+        self.resyncs = 0   # Times the backlog was dropped
+
+    def start(self):
+        """Start the timeline now"""
+        self.deadline = self.clock()
+
+    def wait(self, duration):
+        """Sleep until duration after the previous deadline; return the lateness"""
+        if self.deadline is None:
+            self.start()
+        self.deadline += duration
+        delay = self.deadline - self.clock()
+        if delay > 0:
+            self.sleep(delay)
+        else:
+            self.overruns += 1
+
+        now = self.clock()
+        lateness = now - self.deadline
+        self.lateness.record(lateness)
+        if lateness > self.max_lag:
+            # Too far behind to catch up smoothly, continue from now
+            self.deadline = now
+            self.resyncs += 1
+        return lateness
+
+    def report(self):
+        """Lines describing overruns and the lateness histogram"""
+        return [
+            f"{self.lateness.frames} frames, {self.overruns} overruns, {self.resyncs} resyncs",
+            self.lateness.report(),
+        ]
@@ -0,0 +1,119 @@
+"""
+Animation Player
+
+Streams a delta-encoded animation (see patterns/animation.py) onto a
+wall. Each frame only touches the tiles whose rows changed, and the
+engine only sends the changed rows of those tiles over I2C.
+
+Frames follow their stored durations, or a fixed rate with --fps, paced
+by display/pacing.py so the frame rate does not drift and lateness is
+recorded per frame.
+
+An animation made for a single 8x8 matrix is shown on every tile of the
+wall; a multi-tile animation must match the wall's layout.
+"""
+
+import argparse
+import os
+import time
+
+from display.engine import DisplayEngine
+from display.pacing import FramePacer
+from display.topology import load_topology
+from patterns.animation import Animation, ANIMATION_DIR
+
+
+def load_animation(name):
+    """Load an animation from a path or a name in the animations folder"""
+    if os.path.exists(name):
+        return Animation(name)
+    return Animation(os.path.join(ANIMATION_DIR, f"{name}.leda"))
+
+
+class AnimationPlayer:
+    """Plays animations on a DisplayEngine's canvas at a steady rate"""
+
+    def __init__(self, engine, fps=None, clock=time.monotonic, sleep=time.sleep):
+        self.engine = engine
+        self.fps = fps
+        self.pacer = FramePacer(clock, sleep)
+        self.frames_shown = 0
+
+    def _positions(self, animation):
+        """Canvas tiles to draw each animation tile on"""
+        canvas = self.engine.canvas
+        layout = (animation.tile_columns, animation.tile_rows)
+        if layout == (1, 1):
+            # Same frame on every tile
+            return [[(tx, ty) for ty in range(canvas.rows) for tx in range(canvas.columns)]]
+        if layout == (canvas.columns, canvas.rows):
+            return [[(tx, ty)] for ty in range(canvas.rows) for tx in range(canvas.columns)]
+        raise ValueError(f"Animation is for {layout[0]}x{layout[1]} tiles, "
+                         f"the wall has {canvas.columns}x{canvas.rows}")
+
+    def play(self, animation, loop=True):
+        """Play an animation, forever with loop=True"""
+        canvas = self.engine.canvas
+        positions = self._positions(animation)
+        frame_time = 1 / self.fps if self.fps else None
+        self.pacer.start()
+        while True:
+            first = True
+            for frame_data, duration, tiles in animation.frames():
+                # Frames are deltas from the previous frame, except the first
+                # one of each pass which starts from blank, so redraw it all
+                if first:
+                    tiles = range(len(positions))
+                    first = False
+                for tile in tiles:
+                    pattern_data = frame_data[tile * 8:tile * 8 + 8]
+                    for tx, ty in positions[tile]:
+                        canvas.set_tile(tx, ty, pattern_data)
+                self.engine.show()
+                self.frames_shown += 1
+
+                # Absolute deadlines keep the frame rate steady over long runs
+                self.pacer.wait(frame_time or duration)
+            if not loop:
+                return
+
+    def report(self):
+        """Lines summarizing frames shown and their timing"""
+        return [f"{self.frames_shown} frames shown"] + self.pacer.report()
+
+
+def main(default_topology='1x1'):
+    parser = argparse.ArgumentParser(description="Play an animation on an LED matrix wall")
+    parser.add_argument('animation',
+                        help="Animation file, or the name of one in the animations folder")
+    parser.add_argument('--topology', default=default_topology,
+                        help="Topology file, or the name of one in the topologies folder")
+    parser.add_argument('--emulate', action='store_true',
+                        help="Run on emulated I2C buses instead of real hardware")
+    parser.add_argument('--fps', type=float,
+                        help="Play at a fixed frame rate instead of the stored durations")
+    parser.add_argument('--once', action='store_true',
+                        help="Play the animation once instead of looping")
+    args = parser.parse_args()
+
+    try:
+        animation = load_animation(args.animation)
+    except (OSError, ValueError) as e:
+        print(f"Could not load animation {args.animation}: {e}")
+        return
+    topology = load_topology(args.topology)
+    print(f"Playing {animation.name} ({len(animation)} frames, "
+          f"{animation.total_duration():.1f}s) on {topology.name}. Press Ctrl+C to exit.")
+
+    engine = DisplayEngine(topology, emulate=args.emulate)
+    engine.start()
+    player = AnimationPlayer(engine, fps=args.fps)
+    try:
+        player.play(animation, loop=not args.once)
+        engine.wait()
+    except ValueError as e:
+        print(e)
+    except KeyboardInterrupt:
+        print("\nExiting player")
+    for line in player.report() + engine.report():
+        print(line)
@@ -0,0 +1,95 @@
+"""
+Pattern Library Hot Reload
+
+Watches the pattern pack while the display runs. A background thread
+polls the file's modification time; when the converters write a new
+pack, it is opened on that thread and handed over, and the display loop
+swaps it in between frames with swap(). The matrices keep showing their
+current patterns throughout, so new content never needs a restart.
+
+Packs are replaced with a rename (see patterns/pack.py), so the old pack
+stays readable until the display loop swaps and closes it, and a pack
+is never seen half-written.
+"""
+
+import os
+import threading
+
+from patterns.pack import load_patterns
+
+# How often to check the pattern library for changes (seconds)
+RELOAD_INTERVAL = 2.0
+
+
+def _file_state(path):
+    """Return what identifies a version of a file, or None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class PatternReloader(threading.Thread):
+    """Polls a pattern pack and prepares new versions for the display loop"""
+
+    def __init__(self, path, patterns=None, interval=RELOAD_INTERVAL, loader=load_patterns):
+        super().__init__(name="Pattern reload", daemon=True)
+        self.path = path
+        self.interval = interval
+        self.loader = loader
+        self.reloads = 0
+        self._state = _file_state(path)
+        self.patterns = patterns if patterns is not None else loader(path)
+        self._pending = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.check()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def check(self):
+        """Load the pack if it changed since the last check; return True if it did"""
+        state = _file_state(self.path)
+        if state is None or state == self._state:
+            return False
+        self._state = state
+        try:
+            patterns = self.loader(self.path)
+        except (OSError, ValueError) as e:
+            print(f"Pattern reload: keeping current patterns, could not load {self.path}: {e}")
+            return False
+        if (patterns.tile_columns, patterns.tile_rows) != (self.patterns.tile_columns, self.patterns.tile_rows):
+            print(f"Pattern reload: keeping current patterns, {self.path} is for "
+                  f"{patterns.tile_columns}x{patterns.tile_rows} tiles")
+            patterns.close()
+            return False
+        if not patterns.record_count:
+            print(f"Pattern reload: keeping current patterns, {self.path} is empty")
+            patterns.close()
+            return False
+
+        with self._lock:
+            if self._pending is not None:
+                self._pending.close()  # Never swapped in, superseded
+            self._pending = patterns
+        return True
+
+    def swap(self):
+        """Return the newest patterns, switching over if a reload is ready
+
+        Call from the display loop between frames; the previous patterns
+        are closed, so do not keep references to them.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, None
+        if pending is not None:
+            self.patterns.close()
+            self.patterns = pending
+            self.reloads += 1
+            print(f"Pattern library reloaded: {pending.record_count} distinct patterns ({len(pending)} names)")
+        return self.patterns
@@ -0,0 +1,68 @@
+"""
+Event-Driven Tile Scheduler
+
+Keeps the next change time of every tile in a heap so the display loop
+can sleep exactly until the earliest deadline and then service only the
+tiles that are due, instead of waking on a fixed interval and scanning
+every tile.
+
+Times come from time.monotonic(), so wall clock adjustments (NTP on the
+Pi) never cause skipped or bunched changes. How late each tile change
+actually happens is recorded in a lateness histogram (display/pacing.py).
+"""
+
+import heapq
+import time
+
+from display.pacing import LatenessHistogram, MAX_LAG
+
+
+class TileScheduler:
+    """Min-heap of (deadline, tile) pairs for independently timed tiles"""
+
+    def __init__(self, tile_count, clock=time.monotonic, sleep=time.sleep, max_lag=MAX_LAG):
+        self.clock = clock
+        self.sleep = sleep
+        self.max_lag = max_lag
+        now = clock()
+        # Every tile is due immediately so the first pass fills the display
+        self._heap = [(now, tile) for tile in range(tile_count)]
+        heapq.heapify(self._heap)
+        self.lateness = LatenessHistogram()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def schedule(self, tile, deadline):
+        """Schedule a tile's next change at an absolute monotonic time"""
+        heapq.heappush(self._heap, (deadline, tile))
+
+    def next_deadline(self):
+        """Return the earliest pending deadline, or None if nothing is scheduled"""
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now=None):
+        """Remove and return (tile, deadline) for every tile due at now
+
+        A tile more than max_lag late gets now as its deadline, so the
+        caller schedules its next change from now instead of catching up.
+        """
+        if now is None:
+            now = self.clock()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, tile = heapq.heappop(self._heap)
+            self.lateness.record(now - deadline)
+            if now - deadline > self.max_lag:
+                deadline = now
+            due.append((tile, deadline))
+        return due
+
+    def wait(self):
+        """Sleep until the next deadline and return the tiles that are due"""
+        while self._heap:
+            delay = self._heap[0][0] - self.clock()
+            if delay <= 0:
+                return self.pop_due()
+            self.sleep(delay)
+        return []
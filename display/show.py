@@ -0,0 +1,194 @@
+"""
+Random Pattern Show
+
+Shows random patterns from the pattern library (patterns/led_patterns.bin,
+or patterns/led_patterns.py if no pack has been built) on every tile of
+a wall, each tile changing independently every 1-5 seconds. This is the
+loop behind led-matrix-show.py and the per-layout show scripts.
+
+With --mode wall, whole-wall drawings from the pack for the wall's size
+(e.g. patterns/led_patterns_24x16.bin for a 2x3 wall) are shown instead,
+every tile changing together in one update, optionally with hardware
+fades between drawings (--fade).
+
+The pattern pack is watched while the show runs, and new patterns from
+the converters are picked up without a restart (see display/reload.py).
+"""
+
+import argparse
+import os
+import random
+import time
+
+from display.effects import Effects
+from display.engine import DisplayEngine
+from display.reload import PatternReloader
+from display.scheduler import TileScheduler
+from display.topology import load_topology
+from patterns.pack import load_patterns, layout_pack_path, PACK_PATH
+
+# Possible display durations in seconds
+DISPLAY_TIMES = [1, 2, 3, 4, 5]
+
+# How often to print per-bus queue depth and transfer time (seconds)
+STATS_INTERVAL = 60
+
+
+def display_random_patterns(engine, patterns, display_times=DISPLAY_TIMES, scheduler=None, reloader=None):
+    """Display random patterns on each tile independently
+
+    With a PatternReloader, newly converted patterns are swapped in
+    between frames.
+    """
+    if not patterns.record_count:
+        print("No patterns available in the pattern library")
+        return
+
+    if scheduler is None:
+        scheduler = TileScheduler(len(engine.tiles))  # Next change time for each tile
+    next_stats = time.monotonic() + STATS_INTERVAL
+
+    print(f"{patterns.record_count} distinct patterns ({len(patterns)} names)")
+    print(f"Displaying random patterns on {len(engine.tiles)} matrices. Press Ctrl+C to exit.")
+
+    while True:
+        # Sleep until the next tile is due, then handle only the due ones
+        due = scheduler.wait()
+        if reloader is not None:
+            patterns = reloader.swap()
+        for i, deadline in due:
+            tile = engine.tiles[i]
+
+            # Choose random pattern and display time
+            # Picking a record rather than a name gives every distinct pattern
+            # the same chance, however many duplicate names it has
+            pattern_name, pattern_data = patterns.record_entry(random.randrange(patterns.record_count))
+            display_time = random.choice(display_times)
+
+            engine.canvas.set_tile(tile.x, tile.y, pattern_data)
+            print(f"Bus {tile.bus}, Matrix 0x{tile.address:02X}: Displaying {pattern_name} for {display_time}s")
+
+            # Schedule from the deadline rather than the wake-up time to avoid drift
+            scheduler.schedule(i, deadline + display_time)
+
+        # Hand each bus its changed tiles; buses then transmit concurrently
+        engine.show()
+
+        if time.monotonic() >= next_stats:
+            print_stats(engine, scheduler)
+            next_stats += STATS_INTERVAL
+
+
+def display_wall_patterns(engine, patterns, display_times=DISPLAY_TIMES, scheduler=None, fade=0,
+                          reloader=None):
+    """Display random wall-spanning patterns, all tiles changing together
+
+    With fade > 0 the wall fades out and back in over fade seconds each
+    way around every change, using the chips' dimming register; each
+    pattern is still shown at full brightness for its whole display time. With a
+    PatternReloader, new patterns are swapped in between frames.
+    """
+    canvas = engine.canvas
+    if (patterns.tile_columns, patterns.tile_rows) != (canvas.columns, canvas.rows):
+        print(f"Pattern pack is for {patterns.tile_columns}x{patterns.tile_rows} tiles, "
+              f"the wall has {canvas.columns}x{canvas.rows}")
+        return
+    if not patterns.record_count:
+        print("No patterns available in the pattern library")
+        return
+
+    if scheduler is None:
+        scheduler = TileScheduler(1)  # The whole wall changes as one
+    next_stats = time.monotonic() + STATS_INTERVAL
+
+    print(f"{patterns.record_count} distinct wall patterns ({len(patterns)} names)")
+    print(f"Displaying wall patterns on {len(engine.tiles)} matrices. Press Ctrl+C to exit.")
+
+    effects = Effects(engine) if fade else None
+    first = True
+    while True:
+        due = scheduler.wait()
+        if reloader is not None:
+            patterns = reloader.swap()
+        for _, deadline in due:
+            # One lookup gives the pattern for every tile
+            pattern_name, pattern_data = patterns.record_entry(random.randrange(patterns.record_count))
+            display_time = random.choice(display_times)
+
+            # The fades happen on top of the display time, not within it
+            transition = 0
+            if effects:
+                if not first:
+                    effects.fade_out(fade)
+                    transition += fade
+                transition += fade  # The fade in after show()
+            first = False
+            canvas.load_tiles(pattern_data)
+            print(f"Wall: Displaying {pattern_name} for {display_time}s")
+
+            scheduler.schedule(0, deadline + transition + display_time)
+
+        # All tiles are queued together, so the wall updates at once
+        engine.show()
+        if effects:
+            effects.fade_in(fade)
+
+        if time.monotonic() >= next_stats:
+            print_stats(engine, scheduler)
+            next_stats += STATS_INTERVAL
+
+
+def print_stats(engine, scheduler=None):
+    """Print queue depth and transfer time for each bus, and change lateness"""
+    for line in engine.report():
+        print(line)
+    if scheduler is not None:
+        print(scheduler.lateness.report())
+
+
+def main(default_topology=None):
+    parser = argparse.ArgumentParser(description="Show random patterns on an LED matrix wall")
+    parser.add_argument('--topology', default=default_topology, required=default_topology is None,
+                        help="Topology file, or the name of one in the topologies folder")
+    parser.add_argument('--emulate', action='store_true',
+                        help="Run on emulated I2C buses instead of real hardware")
+    parser.add_argument('--mode', choices=['tiles', 'wall'], default='tiles',
+                        help="tiles: random 8x8 pattern per tile (default), "
+                             "wall: one drawing spanning the whole wall")
+    parser.add_argument('--no-reload', action='store_true',
+                        help="Do not pick up pattern library changes while running")
+    parser.add_argument('--fade', type=float, default=0,
+                        help="In wall mode, fade out and in over this many seconds around each change")
+    args = parser.parse_args()
+
+    topology = load_topology(args.topology)
+    print(f"Starting LED Matrix Display ({topology.name})...")
+
+    if args.mode == 'wall':
+        pack_path = layout_pack_path(topology.columns, topology.rows)
+        if not os.path.exists(pack_path):
+            print(f"No wall patterns found: {pack_path} does not exist")
+            print("Draw with a matching layout in bit-draw.py and run convert-image-to-bytes.py")
+            return
+        tile_count = 1
+    else:
+        pack_path, tile_count = PACK_PATH, len(topology.tiles)
+    patterns = load_patterns(pack_path)
+
+    # Swap in patterns from the converters without restarting the display
+    reloader = None
+    if not args.no_reload:
+        reloader = PatternReloader(pack_path, patterns)
+        reloader.start()
+
+    engine = DisplayEngine(topology, emulate=args.emulate)
+    engine.start()
+    scheduler = TileScheduler(tile_count)  # Created after start() so setup time is not counted as lateness
+    try:
+        if args.mode == 'wall':
+            display_wall_patterns(engine, patterns, scheduler=scheduler, fade=args.fade, reloader=reloader)
+        else:
+            display_random_patterns(engine, patterns, scheduler=scheduler, reloader=reloader)
+    except KeyboardInterrupt:
+        print("\nExiting display")
+        print_stats(engine, scheduler)
@@ -0,0 +1,61 @@
+"""
+SMBus I2C Wrapper
+
+Makes an smbus2 bus (such as the GPIO-based bus 2 on the Pi) look like a
+busio.I2C object so the Adafruit HT16K33 driver can use it.
+
+Features:
+- Real thread-safe bus lock, so worker threads can share the bus
+- Plain I2C writes through i2c_rdwr, without the 32-byte SMBus block limit
+- transfer() sends writes to several devices in one combined transaction
+  (a single ioctl), e.g. a whole row of matrices in one kernel call
+"""
+
+import threading
+
+import smbus2
+from smbus2 import i2c_msg
+
+# The kernel rejects I2C_RDWR requests with more messages than this
+MAX_MESSAGES = 42
+
+
+class SMBusWrapper:
+    """Wrapper class to make SMBus look like busio.I2C"""
+    def __init__(self, bus_number):
+        self.bus = smbus2.SMBus(bus_number)
+        self._lock = threading.Lock()
+
+    def try_lock(self):
+        return self._lock.acquire(blocking=False)
+
+    def unlock(self):
+        self._lock.release()
+
+    def write(self, address, buffer, *, start=0, end=None):
+        self.writeto(address, buffer, start=start, end=end)
+
+    def writeto(self, address, buffer, *, start=0, end=None, stop=True):
+        if end is None:
+            end = len(buffer)
+        if end - start == 0:
+            # Empty write for probing
+            self.bus.write_byte(address, 0)
+        else:
+            self.bus.i2c_rdwr(i2c_msg.write(address, bytes(buffer[start:end])))
+
+    def transfer(self, messages):
+        """Write several (address, data) messages as one combined transaction
+
+        Messages are sent with repeated starts and a single stop, in as few
+        I2C_RDWR calls as the kernel's per-call message limit allows.
+        """
+        msgs = [i2c_msg.write(address, bytes(data)) for address, data in messages]
+        for i in range(0, len(msgs), MAX_MESSAGES):
+            self.bus.i2c_rdwr(*msgs[i:i + MAX_MESSAGES])
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        if end is None:
+            end = len(buffer)
+        data = self.bus.read_i2c_block_data(address, 0, end-start)
+        buffer[start:end] = data
@@ -0,0 +1,112 @@
+"""
+Wall Topology Files
+
+A topology file describes one LED wall: which I2C buses it uses, which
+HT16K33 address sits on which bus, and where each 8x8 tile sits in the
+wall's grid. The display engine builds everything from this file, so a
+new layout needs a new JSON file rather than a new script.
+
+Example (topologies/1x3.json):
+
+{
+    "name": "Three matrices in a row",
+    "brightness": 1.0,
+    "buses": {
+        "1": {"type": "board"}
+    },
+    "tiles": [
+        {"bus": "1", "address": "0x70", "x": 0, "y": 0},
+        {"bus": "1", "address": "0x71", "x": 1, "y": 0},
+        {"bus": "1", "address": "0x72", "x": 2, "y": 0}
+    ]
+}
+
+Bus types:
+- board: the Pi's primary bus via board.I2C()
+- smbus: another Linux I2C bus by number, e.g. the GPIO bus 2
+- emulated: an in-process stand-in (display/emulator.py), with an
+  optional "clock_hz" for the modeled bus speed
+"""
+
+import json
+import os
+from collections import namedtuple
+
+# Default folder holding the topology files that ship with the project
+TOPOLOGY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'topologies')
+
+Tile = namedtuple('Tile', ['bus', 'address', 'x', 'y'])
+
+
+class Topology:
+    """Buses and tile positions for one LED wall"""
+
+    def __init__(self, buses, tiles, brightness=1.0, name=None):
+        self.buses = buses
+        self.tiles = tiles
+        self.brightness = brightness
+        self.name = name or f"{len(tiles)} tiles"
+        # Grid size in tiles
+        self.columns = max(tile.x for tile in tiles) + 1
+        self.rows = max(tile.y for tile in tiles) + 1
+
+
+def _parse_address(value):
+    """Accept addresses written as integers or strings like '0x70'"""
+    if isinstance(value, str):
+        return int(value, 0)
+    return int(value)
+
+
+def parse_topology(config):
+    """Build and validate a Topology from a decoded topology file"""
+    buses = {str(bus_id): dict(bus) for bus_id, bus in config.get('buses', {}).items()}
+    if not buses:
+        raise ValueError("Topology must define at least one bus")
+
+    tiles = []
+    seen_addresses = set()
+    seen_positions = set()
+    for entry in config.get('tiles', []):
+        try:
+            tile = Tile(
+                bus=str(entry['bus']),
+                address=_parse_address(entry['address']),
+                x=int(entry['x']),
+                y=int(entry['y']),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid tile entry {entry}: {e}")
+
+        if tile.bus not in buses:
+            raise ValueError(f"Tile at ({tile.x}, {tile.y}) uses undefined bus {tile.bus}")
+        if tile.x < 0 or tile.y < 0:
+            raise ValueError(f"Tile position ({tile.x}, {tile.y}) must not be negative")
+        if (tile.bus, tile.address) in seen_addresses:
+            raise ValueError(f"Address 0x{tile.address:02X} used twice on bus {tile.bus}")
+        if (tile.x, tile.y) in seen_positions:
+            raise ValueError(f"Two tiles at position ({tile.x}, {tile.y})")
+        seen_addresses.add((tile.bus, tile.address))
+        seen_positions.add((tile.x, tile.y))
+        tiles.append(tile)
+
+    if not tiles:
+        raise ValueError("Topology must define at least one tile")
+
+    brightness = float(config.get('brightness', 1.0))
+    if not 0.0 <= brightness <= 1.0:
+        raise ValueError("Brightness must be between 0.0 and 1.0")
+
+    return Topology(buses, tiles, brightness=brightness, name=config.get('name'))
+
+
+def load_topology(path):
+    """Load a topology file by path, or by name from the topologies folder"""
+    if not os.path.exists(path):
+        candidate = os.path.join(TOPOLOGY_DIR, path)
+        if not candidate.endswith('.json'):
+            candidate += '.json'
+        if os.path.exists(candidate):
+            path = candidate
+    with open(path) as f:
+        return parse_topology(json.load(f))
@@ -0,0 +1,28 @@
+"""
+LED Matrix Animation Player
+
+Plays delta-encoded animations made with convert-animation.py on any
+arrangement of 8x8 LED matrices described by a topology file.
+
+Usage:
+    python led-matrix-play.py my-animation
+    python led-matrix-play.py my-animation --topology 2x3 --fps 20
+
+Features:
+- Per-frame durations from the animation, or a fixed rate with --fps
+- Only tiles and rows that change between frames are sent over I2C
+- Single-matrix animations play on every matrix of the wall
+- Loops until interrupted with Ctrl+C (or plays once with --once)
+
+Hardware:
+- Adafruit HT16K33 8x8 LED Matrices
+- Buses, addresses and tile positions come from the topology file
+  (see the topologies folder for examples)
+- Requires adafruit-circuitpython-ht16k33 library
+  (and smbus2 for additional I2C buses)
+"""
+
+from display.player import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+LED Matrix Wall Display Script
+
+Displays pixel art patterns on any arrangement of 8x8 LED matrices,
+described by a topology file. It reads patterns from the pattern pack
+patterns/led_patterns.bin (or patterns/led_patterns.py if no pack has
+been built) and displays them randomly on each matrix independently.
+
+Usage:
+    python led-matrix-show.py --topology 2x3
+    python led-matrix-show.py --topology path/to/my-wall.json
+
+Features:
+- Any number of matrices on any number of I2C buses
+- Each matrix displays patterns independently
+- Random pattern selection and timing (1-5 seconds)
+- Buses transmit in parallel, and only changed rows are sent
+- Runs continuously until interrupted with Ctrl+C
+
+Hardware:
+- Adafruit HT16K33 8x8 LED Matrices
+- Buses, addresses and tile positions come from the topology file
+  (see the topologies folder for examples)
+- Requires adafruit-circuitpython-ht16k33 library
+  (and smbus2 for additional I2C buses)
+"""
+
+from display.show import main
+
+if __name__ == "__main__":
+    main()
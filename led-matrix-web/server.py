@@ -1,23 +1,355 @@
+import gzip
 import http.server
-import socketserver
+import io
+import json
 import os
+import re
+import struct
+import sys
+import threading
 import webbrowser
+import zlib
+from datetime import datetime
+
+DRAWINGS_DIR = 'web-drawings'
+
+# JSON list of saved drawings, used by the gallery instead of the directory listing
+INDEX_PATH = '/api/drawings'
+
+# POST a drawing here to add it straight to the pattern library
+SAVE_PATH = '/api/patterns'
+MAX_SAVE_BODY = 4096
+
+# The pattern library lives one folder up, next to the display scripts.
+# When the editor is used on its own (e.g. from led-matrix-web.zip) there
+# is no library and only preview images can be saved.
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGE_DATA_DIR = os.path.join(REPO_DIR, 'image-data')
+if os.path.isdir(os.path.join(REPO_DIR, 'patterns')):
+    sys.path.insert(0, REPO_DIR)
+    from patterns.pack import load_patterns, write_pack, PACK_PATH
+else:
+    load_patterns = write_pack = PACK_PATH = None
+
+# Preview images match the editor's "Save Image" output: 36 pixel cells
+# with a 34 pixel LED in the middle, on black
+PREVIEW_CELL = 36
+PREVIEW_LED = 34
+
+# Drawings are requested with their modification time in the URL (?v=...),
+# so a cached copy can be reused without asking; everything else is
+# revalidated with its ETag on every use
+DRAWING_CACHE_CONTROL = 'public, max-age=86400'
+DEFAULT_CACHE_CONTROL = 'no-cache'
+
+# Files sent gzip-compressed to browsers that accept it
+GZIP_EXTENSIONS = ('.html', '.js', '.css')
+
+class GalleryIndex:
+    """JSON index of the drawings folder, rebuilt only when the folder changes"""
+
+    def __init__(self, directory=DRAWINGS_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._body = None
+
+    def body(self):
+        """Return (ETag, JSON body) for the current folder contents"""
+        # Adding, removing or renaming a drawing changes the folder's mtime
+        mtime = os.stat(self.directory).st_mtime_ns
+        with self._lock:
+            if mtime != self._mtime:
+                self._body = self._build()
+                self._mtime = mtime
+            return f'"{mtime:x}"', self._body
+
+    def _build(self):
+        drawings = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.is_file() or not entry.name.lower().endswith('.png'):
+                    continue
+                stat = entry.stat()
+                drawings.append({
+                    'name': entry.name,
+                    'size': stat.st_size,
+                    'mtime': stat.st_mtime_ns // 1_000_000,  # Milliseconds, for JavaScript dates
+                })
+        # Newest first, like the gallery shows them
+        drawings.sort(key=lambda drawing: (drawing['mtime'], drawing['name']), reverse=True)
+        return json.dumps({'drawings': drawings}).encode('utf-8')
+
+class GzipCache:
+    """Compressed copies of static files, redone only when a file changes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, path, stat):
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == key:
+                return entry[1]
+        with open(path, 'rb') as f:
+            body = gzip.compress(f.read())
+        with self._lock:
+            self._entries[path] = (key, body)
+        return body
+
+gallery_index = GalleryIndex()
+gzip_cache = GzipCache()
+
+# Saves read, extend and rewrite the pattern pack, one at a time
+library_lock = threading.Lock()
+
+def png_bytes(width, height, pixels, channels):
+    """Encode 8-bit grayscale (channels=1) or RGB (channels=3) pixels as a PNG"""
+    stride = width * channels
+    raw = b''.join(b'\x00' + pixels[y * stride:(y + 1) * stride] for y in range(height))
+
+    def chunk(kind, data):
+        return (struct.pack('>I', len(data)) + kind + data +
+                struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    color_type = 0 if channels == 1 else 2
+    header = struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) +
+            chunk(b'IDAT', zlib.compress(raw)) + chunk(b'IEND', b''))
+
+def write_file(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def pattern_png(rows):
+    """8x8 black and white image of a pattern, as the converters expect"""
+    pixels = bytes(255 if row & (0x80 >> col) else 0 for row in rows for col in range(8))
+    return png_bytes(8, 8, pixels, 1)
+
+def preview_png(rows, color):
+    """288x288 image of a pattern in the LED color, like the editor's Save Image"""
+    black = b'\x00\x00\x00'
+    gap = (PREVIEW_CELL - PREVIEW_LED) // 2
+    lines = []
+    for row in rows:
+        # Build each distinct scanline once, then repeat it
+        line = b''.join(
+            black * gap + (color if row & (0x80 >> col) else black) * PREVIEW_LED + black * gap
+            for col in range(8)
+        )
+        blank = black * (8 * PREVIEW_CELL)
+        lines += [blank] * gap + [line] * PREVIEW_LED + [blank] * gap
+    size = 8 * PREVIEW_CELL
+    return png_bytes(size, size, b''.join(lines), 3)
+
+def parse_drawing(body):
+    """Return (8 row bytes, RGB color bytes, preview flag) from a save request"""
+    data = json.loads(body)
+    if not isinstance(data, dict):
+        raise ValueError("body must be a JSON object")
+    rows = data.get('rows')
+    if (not isinstance(rows, list) or len(rows) != 8 or
+            not all(isinstance(row, int) and not isinstance(row, bool) and 0 <= row <= 255
+                    for row in rows)):
+        raise ValueError("rows must be a list of 8 numbers from 0 to 255")
+    color = data.get('color', '#FFFFFF')
+    if not isinstance(color, str) or not re.fullmatch(r'#[0-9A-Fa-f]{6}', color):
+        raise ValueError("color must look like #RRGGBB")
+    return bytes(rows), bytes.fromhex(color[1:]), bool(data.get('preview'))
+
+def new_drawing_stem(patterns):
+    """Timestamped file name stem not used by any pattern or image yet"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    stem, number = f"pixel_art_{timestamp}", 1
+    while (f"{stem}_8x8" in patterns or
+           os.path.exists(os.path.join(IMAGE_DATA_DIR, f"{stem}_8x8.png")) or
+           os.path.exists(os.path.join(DRAWINGS_DIR, f"{stem}.png"))):
+        number += 1
+        stem = f"pixel_art_{timestamp}_{number}"
+    return stem
+
+def save_pattern(rows, color, preview=False):
+    """Add a drawing to the pattern library; return (name, pattern count, preview path)
+
+    The 8x8 image also goes to image-data, so the converters keep the
+    pattern when they rebuild the library. Without a library only the
+    preview is saved, and name and count are None.
+    """
+    with library_lock:
+        name = count = None
+        if write_pack is None:
+            stem = new_drawing_stem({})
+        else:
+            try:
+                pack = load_patterns(PACK_PATH)
+                patterns = dict(pack)
+                pack.close()
+            except ImportError:
+                patterns = {}  # No library yet
+            stem = new_drawing_stem(patterns)
+            name = f"{stem}_8x8"
+
+            os.makedirs(IMAGE_DATA_DIR, exist_ok=True)
+            write_file(os.path.join(IMAGE_DATA_DIR, f"{name}.png"), pattern_png(rows))
+            patterns[name] = rows
+            write_pack(PACK_PATH, patterns)
+            count = len(patterns)
+
+        preview_path = None
+        if preview:
+            preview_path = f"{DRAWINGS_DIR}/{stem}.png"
+            write_file(preview_path, preview_png(rows, color))
+    return name, count, preview_path
+
+def file_etag(stat, suffix=''):
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{suffix}"'
+
+class GalleryRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open between requests; every response
+    # carries a Content-Length so the browser knows where each one ends
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] == INDEX_PATH:
+            self.send_gallery_index()
+        else:
+            super().do_GET()
+
+    def do_POST(self):
+        if self.path.split('?', 1)[0] == SAVE_PATH:
+            self.save_drawing()
+        else:
+            self.send_error(405, "Only drawings can be posted, to " + SAVE_PATH)
+
+    def save_drawing(self):
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_SAVE_BODY:
+            # The body is left unread, so it must not be taken for the next request
+            self.close_connection = True
+            if length < 0:
+                self.send_error(400, "Invalid Content-Length")
+            else:
+                self.send_error(413, "Drawing too large")
+            return
+        try:
+            rows, color, preview = parse_drawing(self.rfile.read(length))
+        except ValueError as e:
+            self.send_error(400, f"Invalid drawing: {e}")
+            return
+        if write_pack is None and not preview:
+            self.send_error(503, "No pattern library next to this editor")
+            return
+        try:
+            name, count, preview_path = save_pattern(rows, color, preview)
+        except (OSError, ValueError) as e:
+            self.send_error(500, f"Could not save pattern: {e}")
+            return
+        if name is not None:
+            print(f"Saved pattern {name} ({count} patterns in the library)")
+        self.send_json(201, {'name': name, 'patterns': count, 'preview': preview_path})
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_gallery_index(self):
+        try:
+            etag, body = gallery_index.body()
+        except OSError as e:
+            self.send_error(500, f"Could not read {DRAWINGS_DIR}: {e}")
+            return
+        if self.not_modified(etag, DEFAULT_CACHE_CONTROL):
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', DEFAULT_CACHE_CONTROL)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def not_modified(self, etag, cache_control):
+        """Send 304 Not Modified if the browser already has this version"""
+        if etag not in self.headers.get('If-None-Match', ''):
+            return False
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', cache_control)
+        self.end_headers()
+        return True
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) and self.path.split('?', 1)[0].endswith('/'):
+            index = os.path.join(path, 'index.html')
+            if os.path.isfile(index):
+                path = index
+        if not os.path.isfile(path):
+            self._cache_headers = None
+            return super().send_head()  # Directory listings, redirects and errors
+
+        stat = os.stat(path)
+        in_drawings = os.path.basename(os.path.dirname(path)) == DRAWINGS_DIR
+        cache_control = DRAWING_CACHE_CONTROL if in_drawings else DEFAULT_CACHE_CONTROL
+        accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        compress = accepts_gzip and path.endswith(GZIP_EXTENSIONS)
+
+        etag = file_etag(stat, '-gzip' if compress else '')
+        if self.not_modified(etag, cache_control):
+            return None
+        if compress:
+            body = gzip_cache.get(path, stat)
+            self.send_response(200)
+            self.send_header('Content-Type', self.guess_type(path))
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Last-Modified', self.date_time_string(stat.st_mtime))
+            self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
+            self.end_headers()
+            return io.BytesIO(body)
+
+        # Let the stock handler send the file, adding our headers to it
+        self._cache_headers = [('ETag', etag), ('Cache-Control', cache_control)]
+        if path.endswith(GZIP_EXTENSIONS):
+            self._cache_headers.append(('Vary', 'Accept-Encoding'))
+        return super().send_head()
+
+    def end_headers(self):
+        for name, value in getattr(self, '_cache_headers', None) or ():
+            self.send_header(name, value)
+        self._cache_headers = None
+        super().end_headers()
 
 def run_server(port=8000):
     # Create web-drawings folder if it doesn't exist
-    if not os.path.exists('web-drawings'):
-        os.makedirs('web-drawings')
+    if not os.path.exists(DRAWINGS_DIR):
+        os.makedirs(DRAWINGS_DIR)
         print("Created 'web-drawings' folder")
 
-    # Start the server
+    # Start the server, one thread per connection so a slow image
+    # transfer never holds up anyone else's requests
     try:
-        with socketserver.TCPServer(("", port), http.server.SimpleHTTPRequestHandler) as httpd:
+        with http.server.ThreadingHTTPServer(("", port), GalleryRequestHandler) as httpd:
             print(f"\nServer running at http://localhost:{port}")
             print("Press Ctrl+C to stop the server")
-            
+
             # Open the browser
             webbrowser.open(f'http://localhost:{port}')
-            
+
             try:
                 httpd.serve_forever()
             except KeyboardInterrupt:
@@ -30,4 +362,4 @@ def run_server(port=8000):
             raise
 
 if __name__ == '__main__':
-    run_server() 
\ No newline at end of file
+    run_server()
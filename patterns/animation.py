@@ -0,0 +1,152 @@
+"""
+Delta-Encoded Animations
+
+A compact file format for frame sequences with per-frame durations.
+Each frame only stores the rows that differ from the frame before it,
+XORed with their previous value, so a long animation where little moves
+costs a few bytes per frame on disk, and the player knows exactly which
+tiles changed without comparing frames.
+
+File layout (little-endian):
+- Header (12 bytes): magic 'LEDA', version, tile columns, tile rows,
+  frame count
+- Frames, back to back, each made of:
+  - duration in milliseconds (2 bytes)
+  - change mask: one byte per 8x8 tile in row-major order, bit 7 - r set
+    when row r of that tile changed
+  - one XOR byte (old row ^ new row) per set mask bit, in mask order
+
+The first frame is stored as a delta from a blank display. Frame data
+uses the same layout as pattern pack records: 8 bytes per tile, tiles in
+row-major order (see patterns/pack.py).
+"""
+
+import os
+import struct
+
+MAGIC = b'LEDA'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHBBI')
+FRAME = struct.Struct('<H')
+
+# Default folder for converted animations
+ANIMATION_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'animations')
+
+# Longest duration a single frame can hold
+MAX_DURATION_MS = 0xFFFF
+
+
+def encode_frame(previous, current, duration_ms):
+    """Return the encoded delta taking previous to current"""
+    if not 0 <= duration_ms <= MAX_DURATION_MS:
+        raise ValueError(f"Frame duration must be 0-{MAX_DURATION_MS} ms, got {duration_ms}")
+    mask = bytearray(len(current) // 8)
+    deltas = bytearray()
+    for index, (old, new) in enumerate(zip(previous, current)):
+        if old != new:
+            mask[index // 8] |= 0x80 >> (index % 8)
+            deltas.append(old ^ new)
+    return FRAME.pack(duration_ms) + mask + deltas
+
+
+def write_animation(path, frames, tile_columns=1, tile_rows=1):
+    """Write a list of (frame bytes, duration in ms) pairs as an animation
+
+    The file is written next to its destination and then renamed into
+    place, like pattern packs.
+    """
+    if not frames:
+        raise ValueError("An animation needs at least one frame")
+    frame_size = 8 * tile_columns * tile_rows
+    previous = bytes(frame_size)
+    body = bytearray()
+    for number, (frame_data, duration_ms) in enumerate(frames):
+        frame_data = bytes(frame_data)
+        if len(frame_data) != frame_size:
+            raise ValueError(f"Frame {number} must be {frame_size} bytes, got {len(frame_data)}")
+        body += encode_frame(previous, frame_data, int(duration_ms))
+        previous = frame_data
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, tile_columns, tile_rows, len(frames)))
+        f.write(body)
+    os.replace(tmp_path, path)
+    return HEADER.size + len(body)
+
+
+class Animation:
+    """A decoded-on-demand animation read from a file"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._data = f.read()
+
+        if len(self._data) < HEADER.size:
+            raise ValueError(f"{path} is not an animation")
+        magic, version, self.tile_columns, self.tile_rows, self.frame_count = HEADER.unpack_from(self._data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an animation")
+        if version != VERSION:
+            raise ValueError(f"{path} has unsupported animation version {version}")
+        if not self.frame_count:
+            raise ValueError(f"{path} has no frames")  # Nothing to play, even in a loop
+        self.frame_size = 8 * self.tile_columns * self.tile_rows
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        self._check_frames()
+
+    def _check_frames(self):
+        """Walk the frame table once so truncated or corrupt files fail on load"""
+        mask_size = self.frame_size // 8
+        offset = HEADER.size
+        for _ in range(self.frame_count):
+            mask_end = offset + FRAME.size + mask_size
+            if mask_end > len(self._data):
+                break
+            changed = sum(bin(bits).count('1') for bits in self._data[offset + FRAME.size:mask_end])
+            offset = mask_end + changed
+        else:
+            if offset == len(self._data):
+                return
+        raise ValueError(f"{self.path} is truncated or corrupt")
+
+    def __len__(self):
+        return self.frame_count
+
+    def deltas(self):
+        """Yield (duration in seconds, [(row index, xor byte), ...]) per frame"""
+        mask_size = self.frame_size // 8
+        offset = HEADER.size
+        for _ in range(self.frame_count):
+            duration_ms, = FRAME.unpack_from(self._data, offset)
+            offset += FRAME.size
+            mask = self._data[offset:offset + mask_size]
+            offset += mask_size
+
+            changes = []
+            for tile, bits in enumerate(mask):
+                for row in range(8):
+                    if bits & (0x80 >> row):
+                        changes.append((tile * 8 + row, self._data[offset]))
+                        offset += 1
+            yield duration_ms / 1000, changes
+
+    def frames(self):
+        """Yield (frame bytes, duration in seconds, changed tiles) per frame
+
+        Changed tiles are numbered in row-major order. The first frame is
+        rebuilt from a blank display.
+        """
+        frame = bytearray(self.frame_size)
+        for duration, changes in self.deltas():
+            tiles = set()
+            for index, xor in changes:
+                frame[index] ^= xor
+                tiles.add(index // 8)
+            yield bytes(frame), duration, sorted(tiles)
+
+    def total_duration(self):
+        """Length of one pass through the animation in seconds"""
+        return sum(duration for duration, _ in self.deltas())
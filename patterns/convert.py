@@ -0,0 +1,149 @@
+"""
+Image to Pattern Conversion
+
+Turns images into packed pattern bytes with Pillow doing all the
+per-pixel work: the whole image is thresholded with one lookup table and
+packed to 1 bit per pixel in one tobytes() call, instead of 64
+getpixel() calls and bit shifts in Python per 8x8 image.
+
+Packed format:
+- One bit per pixel, 1 = LED on (pixel brighter than THRESHOLD)
+- Rows packed MSB first (leftmost pixel is bit 7), one byte per 8 pixels
+- An 8x8 image becomes the usual 8-byte pattern
+- Larger images are split into 8x8 tiles by pack_tiles(), one 8-byte
+  pattern per tile in row-major order
+
+iter_jobs() and map_jobs() spread per-file work (decode, resize, threshold) across
+worker processes for bulk conversions.
+
+Dependencies:
+- Pillow (PIL) for image processing
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+# Pixels brighter than this (0-255 grayscale) turn the LED on
+THRESHOLD = 127
+
+# Grayscale -> 1-bit lookup table used by Image.point()
+_THRESHOLD_TABLE = [255 if value > THRESHOLD else 0 for value in range(256)]
+
+
+def threshold(image):
+    """Convert an image to pure black and white (mode '1') at THRESHOLD"""
+    return image.convert('L').point(_THRESHOLD_TABLE, '1')
+
+
+def pack_image(image):
+    """Return the packed rows of an image (8 bytes for an 8x8 image)"""
+    return threshold(image).tobytes()
+
+
+def pack_tiles(image):
+    """Split an image into 8x8 tiles and pack each one as an 8-byte pattern
+
+    Returns (tile_columns, tile_rows, data), where data holds the tile
+    patterns back to back in row-major order (left to right, then top to
+    bottom), the record layout of multi-tile pattern packs. The image
+    must be a whole number of tiles wide and high.
+    """
+    width, height = image.size
+    if width % 8 or height % 8 or not width or not height:
+        raise ValueError(f"Image size {image.size} is not a whole number of 8x8 tiles")
+    tile_columns, tile_rows = width // 8, height // 8
+
+    # Packed rows are tile_columns bytes wide, so a tile is every
+    # stride-th byte of one column, the same slicing as display/canvas.py
+    packed = pack_image(image)
+    stride = tile_columns
+    data = b''.join(
+        packed[ty * 8 * stride + tx:(ty + 1) * 8 * stride:stride]
+        for ty in range(tile_rows)
+        for tx in range(tile_columns)
+    )
+    return tile_columns, tile_rows, data
+
+
+def pack_images(images):
+    """Pack a batch of same-sized images in a single threshold and pack pass
+
+    The images are stacked into one tall grayscale image, so thresholding
+    and bit packing run once for the whole batch. Returns one bytes object
+    per image, in order.
+    """
+    images = list(images)
+    if not images:
+        return []
+    width, height = images[0].size
+    pixels = []
+    for i, image in enumerate(images):
+        if image.size != (width, height):
+            raise ValueError(f"Image {i} is {image.size}, expected {(width, height)}")
+        if image.mode != 'L':
+            image = image.convert('L')
+        pixels.append(image.tobytes())
+    return pack_stack(b''.join(pixels), width, height)
+
+
+def pack_stack(pixels, width, height):
+    """Pack a buffer of 8-bit grayscale images stored back to back
+
+    This is the fast path for data that is already in one buffer (for
+    example a numpy array's bytes): one threshold and one pack for any
+    number of images. Returns one bytes object per image.
+    """
+    count = len(pixels) // (width * height)
+    if count * width * height != len(pixels):
+        raise ValueError(f"Buffer of {len(pixels)} bytes is not a whole number of {width}x{height} images")
+    if count == 0:
+        return []
+    stack = Image.frombytes('L', (width, height * count), bytes(pixels))
+
+    packed = pack_image(stack)
+    size = (width + 7) // 8 * height
+    return [packed[i * size:(i + 1) * size] for i in range(count)]
+
+
+def resolve_jobs(jobs):
+    """Number of worker processes for a --jobs value, 0 meaning all cores"""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def describe_jobs(jobs, count):
+    """Human readable worker count for progress messages"""
+    workers = min(resolve_jobs(jobs), max(count, 1))
+    return "1 process" if workers == 1 else f"{workers} worker processes"
+
+
+def iter_jobs(func, items, jobs=1):
+    """Yield func(item) for every item using up to jobs worker processes
+
+    Results are yielded in the same order as items, so output does not
+    depend on which worker finishes first, and as soon as they are ready,
+    so callers can stream them. jobs=0 uses every CPU core and jobs=1 runs
+    in this process without starting a pool. func must be a module-level
+    function (or a functools.partial of one) so it can be sent to the
+    workers.
+    """
+    items = list(items)
+    jobs = min(resolve_jobs(jobs), len(items))
+    if jobs <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    # A few chunks per worker keeps the load balanced without paying
+    # inter-process overhead for every single image
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(func, items, chunksize=chunksize)
+
+
+def map_jobs(func, items, jobs=1):
+    """List of func(item) for every item, see iter_jobs()"""
+    return list(iter_jobs(func, items, jobs))
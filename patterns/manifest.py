@@ -0,0 +1,154 @@
+"""
+Conversion Manifest
+
+Records, for every source image, its size, modification time, content
+hash and the pattern generated from it. The converters use it to skip
+decoding images that have not changed since the last run, and to rebuild
+the pattern packs (one per tile layout) from cached results.
+
+A file whose size and modification time match its entry is trusted
+without being read. Otherwise it is hashed, and only decoded again if
+its content actually changed.
+
+The packs written from it are recorded the same way, so a pack replaced
+by another tool (e.g. web-image-to-bytes.py) is noticed and rewritten.
+"""
+
+import hashlib
+import json
+import os
+
+MANIFEST_VERSION = 2
+
+# Default manifest, kept next to the pattern pack it describes
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'led_patterns.manifest.json')
+
+
+def file_digest(path):
+    """Return a hash of a file's content"""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+class Manifest:
+    """Source file -> generated pattern records, persisted as JSON"""
+
+    def __init__(self, path=MANIFEST_PATH, load=True):
+        self.path = path
+        self.files = {}
+        self.packs = {}
+        self.changed = not load           # The manifest needs saving
+        self.patterns_changed = not load  # The packs need rebuilding
+        if not load:
+            return  # Start empty, e.g. for a full rebuild
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.files = data.get('files', {})
+                self.packs = data.get('packs', {})
+        except (OSError, ValueError):
+            pass  # Missing or unreadable manifest means a full rebuild
+
+    def lookup(self, source_path):
+        """Return (cached entry or None, stat, digest) for a source file
+
+        digest is only computed when size or modification time changed,
+        and is None otherwise.
+        """
+        stat = os.stat(source_path)
+        entry = self.files.get(source_path)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry, stat, None
+
+        digest = file_digest(source_path)
+        if entry and entry['digest'] == digest:
+            # Touched but not changed: refresh the timestamps only
+            entry['size'] = stat.st_size
+            entry['mtime_ns'] = stat.st_mtime_ns
+            self.changed = True
+            return entry, stat, digest
+        return None, stat, digest
+
+    def update(self, source_path, stat, digest, pattern_name, pattern_data, tiles=(1, 1)):
+        """Record the pattern generated from a source file
+
+        pattern_data is None for files that could not be converted, so
+        they are not retried until they change. tiles is the (columns,
+        rows) tile layout of the pattern.
+        """
+        self.files[source_path] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'digest': digest,
+            'name': pattern_name,
+            'pattern': bytes(pattern_data).hex() if pattern_data is not None else None,
+            'tiles': list(tiles),
+        }
+        self.changed = True
+        self.patterns_changed = True
+
+    def prune(self, source_paths):
+        """Drop entries for source files that no longer exist; return how many"""
+        keep = set(source_paths)
+        removed = [path for path in self.files if path not in keep]
+        for path in removed:
+            del self.files[path]
+        if removed:
+            self.changed = True
+            self.patterns_changed = True
+        return len(removed)
+
+    def layouts(self):
+        """Return the set of (columns, rows) tile layouts with patterns"""
+        return {
+            tuple(entry['tiles'])
+            for entry in self.files.values()
+            if entry.get('pattern') is not None
+        }
+
+    def patterns(self, tiles=(1, 1)):
+        """Return {name: bytes} for every source of one tile layout, in path order"""
+        return {
+            entry['name']: bytes.fromhex(entry['pattern'])
+            for _, entry in sorted(self.files.items())
+            if entry.get('pattern') is not None and tuple(entry['tiles']) == tuple(tiles)
+        }
+
+    def record_pack(self, pack_path, tiles=(1, 1)):
+        """Remember the size and modification time of a pack just written"""
+        stat = os.stat(pack_path)
+        self.packs[os.path.basename(pack_path)] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'tiles': list(tiles),
+        }
+        self.changed = True
+
+    def pack_current(self, pack_path):
+        """Return True if a pack is still the one recorded by record_pack()"""
+        entry = self.packs.get(os.path.basename(pack_path))
+        try:
+            stat = os.stat(pack_path)
+        except OSError:
+            return False
+        return bool(entry) and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns
+
+    def stale_layouts(self):
+        """Return the tile layouts that have a pack recorded but no patterns left"""
+        layouts = self.layouts() | {(1, 1)}
+        return {tuple(entry['tiles']) for entry in self.packs.values()} - layouts
+
+    def forget_pack(self, pack_path):
+        """Stop tracking a pack that was removed"""
+        if self.packs.pop(os.path.basename(pack_path), None) is not None:
+            self.changed = True
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': MANIFEST_VERSION, 'files': self.files, 'packs': self.packs},
+                      f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.changed = False
+        self.patterns_changed = False
@@ -0,0 +1,315 @@
+"""
+Binary Pattern Pack
+
+A compact, memory-mappable file format for the pattern library, used
+instead of a generated Python module. Opening a pack only reads its
+header; pattern data and names are read straight from the mapped file
+on demand, so startup time and memory stay flat no matter how many
+patterns the library holds.
+
+Patterns are content-addressed: each distinct pattern is stored once,
+keyed by a hash of its bits (see pattern_key()), and every name that
+holds the same bits is an alias pointing at that one record.
+
+File layout (little-endian):
+- Header (32 bytes): magic 'LEDP', version, tile columns, tile rows,
+  record count, name count, and offsets of the four sections below
+- Records: fixed-width pattern data, 8 bytes per 8x8 tile, unique and
+  sorted by content key. Multi-tile records hold their tiles back to
+  back in row-major order (see record_tiles())
+- Name index: one fixed-width entry per name, sorted by name, holding
+  the name's offset and length in the names section and its record number
+- Names: UTF-8 pattern names, back to back
+- Primary names: for each record, the index position of its first name
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+
+MAGIC = b'LEDP'
+VERSION = 2
+
+HEADER = struct.Struct('<4sHBBIIIIII')
+INDEX_ENTRY = struct.Struct('<IHI')
+PRIMARY_ENTRY = struct.Struct('<I')
+
+# Default pack written by the converters and read by the display
+PACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'led_patterns.bin')
+
+# Packs for drawings spanning several tiles, by size in pixels
+LAYOUT_PACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'led_patterns_{width}x{height}.bin')
+
+# Python module used before packs existed, still written on request
+MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'led_patterns.py')
+
+
+def pattern_key(pattern_data):
+    """Return the content key of a pattern: a hash of its bits as hex"""
+    return hashlib.blake2b(bytes(pattern_data), digest_size=8).hexdigest()
+
+
+def layout_pack_path(tile_columns, tile_rows):
+    """Return the pack path for drawings of tile_columns x tile_rows tiles
+
+    Single 8x8 patterns live in PACK_PATH; every larger layout has its own
+    pack named after its size in pixels, like the drawings themselves
+    (e.g. led_patterns_24x16.bin for 3 columns by 2 rows).
+    """
+    if (tile_columns, tile_rows) == (1, 1):
+        return PACK_PATH
+    return LAYOUT_PACK_PATH.format(width=8 * tile_columns, height=8 * tile_rows)
+
+
+def record_tiles(pattern_data, tile_columns, tile_rows):
+    """Yield (tx, ty, 8-byte pattern) for every tile of a multi-tile record"""
+    for ty in range(tile_rows):
+        for tx in range(tile_columns):
+            start = (ty * tile_columns + tx) * 8
+            yield tx, ty, pattern_data[start:start + 8]
+
+
+def write_pack(path, patterns, tile_columns=1, tile_rows=1):
+    """Write a {name: bytes} dictionary as a pattern pack
+
+    Identical patterns are stored once, with all their names as aliases.
+    The file is written next to its destination and then renamed into
+    place, so a running display never sees a half-written pack.
+    """
+    record_size = 8 * tile_columns * tile_rows
+    by_content = {}
+    for name, pattern_data in patterns.items():
+        pattern_data = bytes(pattern_data)
+        if len(pattern_data) != record_size:
+            raise ValueError(f"Pattern {name} must be {record_size} bytes, got {len(pattern_data)}")
+        by_content.setdefault(pattern_data, []).append(name.encode('utf-8'))
+
+    records = sorted(by_content, key=pattern_key)
+    entries = sorted(
+        (encoded, number)
+        for number, pattern_data in enumerate(records)
+        for encoded in by_content[pattern_data]
+    )
+
+    records_offset = HEADER.size
+    index_offset = records_offset + len(records) * record_size
+    names_offset = index_offset + len(entries) * INDEX_ENTRY.size
+
+    index = bytearray()
+    names = bytearray()
+    primary = [None] * len(records)
+    for position, (encoded, number) in enumerate(entries):
+        index += INDEX_ENTRY.pack(len(names), len(encoded), number)
+        names += encoded
+        if primary[number] is None:
+            primary[number] = position
+    primary_offset = names_offset + len(names)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, tile_columns, tile_rows, len(records),
+                            len(entries), records_offset, index_offset, names_offset,
+                            primary_offset))
+        f.write(b''.join(records))
+        f.write(index)
+        f.write(names)
+        f.write(b''.join(PRIMARY_ENTRY.pack(position) for position in primary))
+    os.replace(tmp_path, path)
+
+
+def format_pattern(pattern_name, pattern_data):
+    """Format a pattern as an entry of the PATTERNS dictionary"""
+    pattern_lines = [f"    '{pattern_name}': bytes([", "        # 8x8 matrix pattern"]
+    for byte_val in pattern_data:
+        # Format as binary literal
+        pattern_lines.append(f"        0b{byte_val:08b},")
+    pattern_lines.append("    ]),")
+    return "\n".join(pattern_lines)
+
+
+def write_patterns_module(path, patterns, source="8x8 PNG files"):
+    """Write patterns as Python source defining a PATTERNS dictionary"""
+    with open(path, 'w') as f:
+        f.write("# LED Matrix Patterns\n")
+        f.write(f"# Auto-generated from {source}\n\n")
+        f.write("PATTERNS = {\n")
+        for pattern_name, pattern_data in patterns.items():
+            f.write(format_pattern(pattern_name, pattern_data))
+            f.write("\n\n")
+        f.write("}\n")
+
+
+class PatternPack(Mapping):
+    """Read-only {name: bytes} view of a memory-mapped pattern pack"""
+
+    def __init__(self, path=PACK_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a pattern pack")
+        (magic, version, self.tile_columns, self.tile_rows, self.record_count,
+         self._name_count, self._records_offset, self._index_offset,
+         self._names_offset, self._primary_offset) = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a pattern pack")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"{path} has unsupported pack version {version}, run the converter again")
+        self.record_size = 8 * self.tile_columns * self.tile_rows
+
+        # Sections must follow each other and fit in the file; a truncated
+        # or partly copied pack is rejected here rather than failing later
+        primary_end = self._primary_offset + self.record_count * PRIMARY_ENTRY.size
+        if (not self.record_size or
+                self._records_offset < HEADER.size or
+                self._index_offset != self._records_offset + self.record_count * self.record_size or
+                self._names_offset != self._index_offset + self._name_count * INDEX_ENTRY.size or
+                self._primary_offset < self._names_offset or
+                primary_end > len(self._map)):
+            self.close()
+            raise ValueError(f"{path} is truncated or corrupt, run the converter again")
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record(self, number):
+        """Return the pattern data of a record by number"""
+        if not 0 <= number < self.record_count:
+            raise IndexError(f"Record {number} out of range")
+        start = self._records_offset + number * self.record_size
+        return self._map[start:start + self.record_size]
+
+    def record_entry(self, number):
+        """Return (primary name, pattern data) of a record by number"""
+        data = self.record(number)
+        position, = PRIMARY_ENTRY.unpack_from(self._map, self._primary_offset + number * PRIMARY_ENTRY.size)
+        return self.entry(position)[0], data
+
+    def find_key(self, key):
+        """Return the record number holding the pattern with a content key"""
+        # Records are sorted by key, so binary search hashing only log(n) records
+        low, high = 0, self.record_count
+        while low < high:
+            middle = (low + high) // 2
+            if pattern_key(self.record(middle)) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.record_count and pattern_key(self.record(low)) == key:
+            return low
+        raise KeyError(key)
+
+    def _index_entry(self, position):
+        return INDEX_ENTRY.unpack_from(self._map, self._index_offset + position * INDEX_ENTRY.size)
+
+    def _name(self, position):
+        offset, length, _ = self._index_entry(position)
+        start = self._names_offset + offset
+        return self._map[start:start + length]
+
+    def entry(self, position):
+        """Return (name, pattern data) for the position-th name in sorted order"""
+        if not 0 <= position < self._name_count:
+            raise IndexError(f"Entry {position} out of range")
+        offset, length, number = self._index_entry(position)
+        start = self._names_offset + offset
+        return self._map[start:start + length].decode('utf-8'), self.record(number)
+
+    def __len__(self):
+        return self._name_count
+
+    def __iter__(self):
+        for position in range(self._name_count):
+            yield self._name(position).decode('utf-8')
+
+    def __getitem__(self, name):
+        encoded = name.encode('utf-8')
+        # Binary search over the sorted index, reading names from the map
+        low, high = 0, self._name_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name(middle) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._name_count and self._name(low) == encoded:
+            return self.record(self._index_entry(low)[2])
+        raise KeyError(name)
+
+
+class MemoryPack(Mapping):
+    """PatternPack-compatible view of an in-memory {name: bytes} dictionary"""
+
+    def __init__(self, patterns, tile_columns=1, tile_rows=1):
+        self.tile_columns = tile_columns
+        self.tile_rows = tile_rows
+        self.record_size = 8 * tile_columns * tile_rows
+        self._patterns = {name: bytes(data) for name, data in patterns.items()}
+        self._names = sorted(self._patterns)
+
+        # Same record order and primary names as write_pack() produces
+        primary = {}
+        for name in self._names:
+            primary.setdefault(self._patterns[name], name)
+        self._records = sorted(primary, key=pattern_key)
+        self._primary = [primary[data] for data in self._records]
+        self.record_count = len(self._records)
+
+    def close(self):
+        pass
+
+    def record(self, number):
+        return self._records[number]
+
+    def record_entry(self, number):
+        return self._primary[number], self._records[number]
+
+    def find_key(self, key):
+        for number, data in enumerate(self._records):
+            if pattern_key(data) == key:
+                return number
+        raise KeyError(key)
+
+    def entry(self, position):
+        name = self._names[position]
+        return name, self._patterns[name]
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __getitem__(self, name):
+        return self._patterns[name]
+
+
+def load_patterns(path=PACK_PATH):
+    """Open the pattern pack, falling back to patterns/led_patterns.py
+
+    Patterns in the Python module that are not 8 bytes are skipped.
+    """
+    if os.path.exists(path):
+        return PatternPack(path)
+
+    from patterns.led_patterns import PATTERNS
+
+    patterns = {}
+    for name, pattern_data in PATTERNS.items():
+        if len(pattern_data) != 8:
+            print(f"Skipping pattern {name}: must be 8 bytes, got {len(pattern_data)}")
+            continue
+        patterns[name] = bytes(pattern_data)
+    return MemoryPack(patterns)
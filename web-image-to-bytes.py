@@ -5,15 +5,29 @@ import os
 import glob
 from datetime import datetime
 import shutil
+import argparse
+from functools import partial
+from patterns.convert import pack_image, threshold, iter_jobs, describe_jobs
+from patterns.pack import write_pack, write_patterns_module, PACK_PATH, MODULE_PATH
 
-def ensure_directories():
+def ensure_directories(save_png=False):
     """Create necessary directories if they don't exist"""
-    for directory in ['patterns', 'image-data']:
+    for directory in ['patterns', 'image-data'] if save_png else ['patterns']:
         if not os.path.exists(directory):
             os.makedirs(directory)
 
-def process_web_image(image_path):
-    """Process a 288x288 web image to 8x8 format and save to image-data"""
+def web_pattern_name(image_path):
+    """Pattern name for a web drawing, taken from its modification time"""
+    mod_time = os.path.getmtime(image_path)
+    timestamp = datetime.fromtimestamp(mod_time).strftime("%Y%m%d_%H%M%S")
+    return f"pixel_art_{timestamp}_8x8"
+
+def process_web_image(image_path, save_png=False):
+    """Convert a 288x288 web image to a (pattern name, 8 pattern bytes) pair
+    
+    Everything happens in memory. With save_png=True the 8x8 image is also
+    saved to image-data for the other tools.
+    """
     try:
         # Open and verify image
         image = Image.open(image_path)
@@ -23,133 +37,84 @@ def process_web_image(image_path):
             print(f"Skipping {image_path}: Invalid dimensions {image.size}, must be 288x288")
             return None
             
-        # Get file modification time
-        mod_time = os.path.getmtime(image_path)
-        timestamp = datetime.fromtimestamp(mod_time).strftime("%Y%m%d_%H%M%S")
-        
-        # Create new filename
-        new_filename = f"pixel_art_{timestamp}_8x8.png"
-        new_path = os.path.join("image-data", new_filename)
-        
-        # Convert to grayscale first to remove color information
-        image = image.convert('L')
+        pattern_name = web_pattern_name(image_path)
         
         # Convert to pure black and white (binary) using a threshold
         # Any pixel > 127 becomes white (255), anything else becomes black (0)
-        image = image.point(lambda x: 255 if x > 127 else 0, '1')
+        image = threshold(image)
         
         # Now resize to 8x8 using nearest neighbor to maintain sharp edges
         small_image = image.resize((8, 8), Image.NEAREST)
         
-        # Save the processed image
-        small_image.save(new_path)
-        print(f"Processed and saved: {new_path}")
+        if save_png:
+            new_path = os.path.join("image-data", f"{pattern_name}.png")
+            small_image.save(new_path)
+            print(f"Processed and saved: {new_path}")
         
-        return new_path
+        # Bit-pack straight from the in-memory 8x8 image
+        return pattern_name, pack_image(small_image)
         
     except Exception as e:
         print(f"Error processing {image_path}: {e}")
         return None
 
-def image_to_pattern(image_path):
-    """Convert an 8x8 image to LED matrix pattern format"""
-    try:
-        # Open and verify image
-        image = Image.open(image_path)
-        
-        # Verify image is 8x8
-        if image.size != (8, 8):
-            print(f"Skipping {image_path}: Invalid dimensions {image.size}, must be 8x8")
-            return None
-            
-        # Convert to black and white
-        image = image.convert('L')
-        
-        # Create pattern string
-        pattern_lines = []
-        
-        # Add header
-        pattern_name = os.path.basename(image_path).split('.')[0]
-        pattern_lines.append(f"    '{pattern_name}': bytes([")
-        pattern_lines.append("        # 8x8 matrix pattern")
-        
-        # Process each row
-        for y in range(8):
-            byte_val = 0
-            # Process each pixel in the row
-            for x in range(8):
-                pixel = image.getpixel((x, y))
-                # Convert pixel to bit (white = 1, black = 0)
-                bit = 1 if pixel > 127 else 0
-                byte_val |= (bit << (7 - x))
-            
-            # Format as binary literal
-            binary_str = f"        0b{byte_val:08b},"
-            pattern_lines.append(binary_str)
-        
-        # Close the pattern
-        pattern_lines.append("    ]),")
-        
-        return "\n".join(pattern_lines)
-        
-    except Exception as e:
-        print(f"Error processing {image_path}: {e}")
-        return None
+def web_patterns(image_paths, save_png=False, jobs=1):
+    """Yield (pattern name, pattern bytes) for each usable web image, in order"""
+    convert = partial(process_web_image, save_png=save_png)
+    for result in iter_jobs(convert, image_paths, jobs):
+        if result is not None:
+            yield result
 
-def convert_all_images():
-    """Convert all web drawings to 8x8 format and then to pattern format"""
-    ensure_directories()
+def convert_all_images(write_module=False, save_png=False, jobs=1):
+    """Convert all web drawings to a pattern pack
+    
+    Images are processed in jobs worker processes (0 = one per CPU core).
+    With save_png=True the 8x8 versions are also written to image-data.
+    """
+    ensure_directories(save_png)
     
     # Process web drawings first
-    web_images = glob.glob("led-matrix-web/web-drawings/*.png")
+    web_images = sorted(glob.glob("led-matrix-web/web-drawings/*.png"))
     if not web_images:
         print("No images found in 'led-matrix-web/web-drawings' directory")
         return
     
     print(f"Found {len(web_images)} web images to process")
     
-    # Process each web image to 8x8 format
-    processed_images = []
-    for image_path in web_images:
-        print(f"Processing {os.path.basename(image_path)}...")
-        processed_path = process_web_image(image_path)
-        if processed_path:
-            processed_images.append(processed_path)
+    # Stream each web image straight to pattern bytes
+    # Results come back in file order, so the pack is the same for any --jobs
+    print(f"Processing with {describe_jobs(jobs, len(web_images))}...")
+    patterns = {}
+    for pattern_name, pattern_data in web_patterns(web_images, save_png, jobs):
+        patterns[pattern_name] = pattern_data
     
-    if not processed_images:
+    if not patterns:
         print("No images were successfully processed")
         return
     
-    print(f"\nConverting {len(processed_images)} processed images to patterns...")
-    
-    # Create patterns file
-    with open("patterns/led_patterns.py", "w") as f:
-        # Write file header
-        f.write("# LED Matrix Patterns\n")
-        f.write("# Auto-generated from web drawings\n\n")
-        f.write("PATTERNS = {\n")
-        
-        # Process each processed image
-        for image_path in processed_images:
-            print(f"Converting {os.path.basename(image_path)} to pattern...")
-            
-            # Convert image to pattern
-            pattern_text = image_to_pattern(image_path)
-            if pattern_text is None:
-                continue
-                
-            # Write pattern to file
-            f.write(pattern_text)
-            f.write("\n\n")
-        
-        # Close the patterns dictionary
-        f.write("}\n")
+    # Write the binary pack read by the display scripts
+    # Identical patterns are stored once, their other names become aliases
+    write_pack(PACK_PATH, patterns)
+    distinct = len(set(patterns.values()))
+    print(f"\n{len(patterns)} patterns saved to patterns/led_patterns.bin "
+          f"({distinct} distinct, {len(patterns) - distinct} duplicates stored as aliases)")
     
-    print(f"\nPatterns saved to patterns/led_patterns.py")
+    if write_module:
+        write_patterns_module(MODULE_PATH, patterns, source="web drawings")
+        print("Patterns module saved to patterns/led_patterns.py")
 
 def main():
+    parser = argparse.ArgumentParser(description="Convert web drawings into LED matrix patterns")
+    parser.add_argument('--module', action='store_true',
+                        help="Also write patterns/led_patterns.py as Python source")
+    parser.add_argument('--save-png', action='store_true',
+                        help="Also save the 8x8 images to image-data")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="Worker processes to convert with (0 = all CPU cores, default 1)")
+    args = parser.parse_args()
+    
     print("Starting image conversion...")
-    convert_all_images()
+    convert_all_images(write_module=args.module, save_png=args.save_png, jobs=args.jobs)
     print("Conversion complete!")
 
 if __name__ == "__main__":